@@ -0,0 +1,7 @@
+import sys
+
+import benchmarks.bench_threads  # noqa: F401
+import benchmarks.bench_units  # noqa: F401
+from benchmarks.harness import main
+
+sys.exit(main())
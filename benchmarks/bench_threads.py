@@ -0,0 +1,80 @@
+"""
+Stress benchmarks of a frozen units library shared between threads. Values
+are wall times per operation, across all threads: without contention, they
+decrease as threads are added on free-threaded Python builds.
+
+Chunked conversions of large NumPy arrays release the GIL: their wall time
+decreases as workers are added, up to the number of cores.
+"""
+
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from benchmarks.harness import benchmark
+
+OPERATIONS = 20_000
+KEYS = ["m", "ft", "km", "GW", "kW", "psi"]
+
+
+def _library():
+    from planck import _registry
+    from planck.units import Units
+
+    lib = Units({})
+    lib.load(_registry.DEFINITIONS)
+    return lib.freeze()
+
+
+def _stress(func, threads: int, repeat: int = 3) -> float:
+    def work(_):
+        for _ in range(OPERATIONS):
+            func()
+
+    best = None
+    with ThreadPoolExecutor(threads) as executor:
+        for _ in range(repeat):
+            t0 = time.perf_counter()
+            list(executor.map(work, range(threads)))
+            dt = (time.perf_counter() - t0) / (OPERATIONS * threads)
+            best = dt if best is None else min(best, dt)
+    return best
+
+
+def _lookup(lib):
+    def func():
+        for k in KEYS:
+            lib[k][k]
+
+    return func
+
+
+def _convert(lib):
+    return lambda: lib.convert(1.0, "GW", "hp")
+
+
+for _threads in [1, 2, 4, 8]:
+
+    @benchmark(name=f"threads_lookup_{_threads}")
+    def _bench_lookup(threads=_threads):
+        return _stress(_lookup(_library()), threads)
+
+    @benchmark(name=f"threads_convert_{_threads}")
+    def _bench_convert(threads=_threads):
+        return _stress(_convert(_library()), threads)
+
+
+def _convert_array(workers: int):
+    import numpy as np
+
+    from planck import units
+
+    values = np.random.rand(10_000_000)
+    out = np.empty_like(values)
+    return lambda: units.convert(values, "degc", "F", out=out, workers=workers)
+
+
+for _workers in [1, 2, 4, 8]:
+
+    @benchmark(name=f"threads_convert_numpy_10m_{_workers}", requires="numpy")
+    def _bench_convert_array(workers=_workers):
+        return _convert_array(workers)
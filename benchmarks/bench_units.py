@@ -0,0 +1,264 @@
+"""
+Benchmarks of the units and constants libraries hot paths.
+"""
+
+import atexit
+import os
+import subprocess
+import sys
+
+from benchmarks.harness import benchmark
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Modules only imported when used, not on cold start
+DEFERRED = (
+    "hashlib",
+    "planck._files",
+    "planck._frames",
+    "planck._search",
+    "planck._streams",
+    "planck.models.converter",
+    "planck.models.quantity",
+)
+
+
+def _run(code: str) -> float:
+    out = subprocess.check_output([sys.executable, "-c", code], cwd=ROOT, text=True)
+    return float(out.strip().splitlines()[-1])
+
+
+def _min_run(code: str, repeat: int = 5) -> float:
+    return min(_run(code) for _ in range(repeat))
+
+
+# --------------------------------------------------------------------------- #
+# Import and Build                                                            #
+# --------------------------------------------------------------------------- #
+
+
+@benchmark()
+def import_planck():
+    return _min_run(
+        "import time; t0 = time.perf_counter(); import planck; "
+        "print(time.perf_counter() - t0)"
+    )
+
+
+@benchmark()
+def cold_start():
+    # Import and first lookup, as in short-lived workers. Fails if a helper
+    # not needed to look up units is imported eagerly.
+    return _min_run(
+        "import sys, time; t0 = time.perf_counter(); import planck; "
+        "planck.units['m']['ft']; dt = time.perf_counter() - t0; "
+        f"assert not [m for m in sys.modules if m in {DEFERRED!r}]; print(dt)"
+    )
+
+
+@benchmark()
+def import_constants():
+    return _min_run(
+        "import time; t0 = time.perf_counter(); from planck import constants; "
+        "print(time.perf_counter() - t0)"
+    )
+
+
+@benchmark()
+def resolve_all_units():
+    return _min_run(
+        "import time; t0 = time.perf_counter(); from planck import units; "
+        "[units[k] for k in units]; print(time.perf_counter() - t0)"
+    )
+
+
+@benchmark(unit="bytes")
+def registry_memory():
+    return _run(
+        "import tracemalloc, planck, planck._registry; tracemalloc.start(); "
+        "from planck import units; [units[k][k] for k in units]; "
+        "print(tracemalloc.get_traced_memory()[0])"
+    )
+
+
+@benchmark()
+def register_many_500():
+    return _min_run(
+        "import time; from planck import _registry, models; "
+        "from planck.units import Units; lib = Units(); "
+        "lib.load(_registry.DEFINITIONS); [lib[k][k] for k in lib]; "
+        "new = [models.Unit(symbol=f'u{i}', quantity='length', "
+        "values={'m': float(i + 1)}) for i in range(500)]; "
+        "t0 = time.perf_counter(); lib.register_many(new); "
+        "lib.convert(1.0, 'u499', 'm'); print(time.perf_counter() - t0)"
+    )
+
+
+# --------------------------------------------------------------------------- #
+# Conversions                                                                 #
+# --------------------------------------------------------------------------- #
+
+
+@benchmark()
+def convert_scalar():
+    from planck import units
+
+    return lambda: units.convert(1.0, "m", "ft")
+
+
+@benchmark()
+def converter_scalar():
+    from planck import units
+
+    conv = units.converter("m", "ft")
+    return lambda: conv(1.0)
+
+
+@benchmark()
+def convert_list_1k():
+    from planck import units
+
+    values = [float(i) for i in range(1000)]
+    return lambda: units.convert(values, "m", "ft")
+
+
+@benchmark(requires="numpy")
+def convert_numpy_1m():
+    import numpy as np
+    from planck import units
+
+    values = np.random.rand(1_000_000)
+    return lambda: units.convert(values, "m", "ft")
+
+
+@benchmark(requires="numpy")
+def convert_numpy_1m_float32_out():
+    import numpy as np
+    from planck import units
+
+    values = np.random.rand(1_000_000).astype("float32")
+    out = np.empty_like(values)
+    return lambda: units.convert(values, "m", "ft", out=out)
+
+
+@benchmark(requires="numpy")
+def convert_many_numpy_100k():
+    import numpy as np
+    from planck import units
+
+    values = np.random.rand(100_000)
+    input_units = np.array(["m", "ft", "km", "degc"] * 25_000)
+    output_units = np.array(["ft", "m", "mi", "F"] * 25_000)
+    return lambda: units.convert_many(values, input_units, output_units)
+
+
+@benchmark()
+def iconvert_100k():
+    from planck import units
+
+    return lambda: sum(units.iconvert(range(100_000), "psi", "kPa"))
+
+
+@benchmark(requires="numpy")
+def isa_numpy_1m():
+    import numpy as np
+    from planck import atmosphere
+
+    altitude = np.random.rand(1_000_000) * 60_000.0
+    out = tuple(np.empty_like(altitude) for _ in range(4))
+    return lambda: atmosphere.isa(altitude, "ft", out=out)
+
+
+@benchmark(requires="numpy")
+def convert_parallel_numpy_10m():
+    from concurrent.futures import ProcessPoolExecutor
+
+    from planck import units
+    from planck.shared import SharedArray
+
+    shared = SharedArray(10_000_000)
+    shared.array[:] = 1.0
+    atexit.register(shared.__exit__)
+    executor = ProcessPoolExecutor(os.cpu_count())
+    return lambda: units.convert_parallel(shared, "m", "ft", executor=executor)
+
+
+@benchmark(requires="numpy")
+def convert_file_npy_4m():
+    import tempfile
+
+    import numpy as np
+    from planck import units
+
+    directory = tempfile.TemporaryDirectory()
+    atexit.register(directory.cleanup)
+    source = os.path.join(directory.name, "source.npy")
+    destination = os.path.join(directory.name, "destination.npy")
+    np.save(source, np.random.rand(4_000_000))
+    return lambda: units.convert_file(source, destination, "psi", "Pa")
+
+
+@benchmark()
+def units_attach():
+    return _min_run(
+        "import time; from planck import units; from planck.units import Units; "
+        "block = units.share(); t0 = time.perf_counter(); "
+        "Units.attach(block.name).convert(1.0, 'm', 'ft'); "
+        "dt = time.perf_counter() - t0; block.close(); block.unlink(); print(dt)"
+    )
+
+
+@benchmark()
+def convert_temperature_scalar():
+    from planck import units
+
+    return lambda: units.convert(20.0, "degc", "F")
+
+
+@benchmark(requires="numpy")
+def convert_temperature_numpy_1m():
+    import numpy as np
+    from planck import units
+
+    values = np.random.rand(1_000_000)
+    return lambda: units.convert(values, "degc", "F")
+
+
+@benchmark()
+def convert_expression_scalar():
+    from planck import units
+
+    return lambda: units.convert(1.0, "lb*ft/s2", "N")
+
+
+# --------------------------------------------------------------------------- #
+# Lookups                                                                     #
+# --------------------------------------------------------------------------- #
+
+
+@benchmark()
+def units_lookup():
+    from planck import units
+
+    return lambda: units["m"]["ft"]
+
+
+@benchmark()
+def units_find():
+    from planck import units
+
+    return lambda: units.find("m")
+
+
+@benchmark()
+def units_find_quantity():
+    from planck import units
+
+    return lambda: units.find(quantity="length")
+
+
+@benchmark()
+def constants_find():
+    from planck import constants
+
+    return lambda: constants.find("isa")
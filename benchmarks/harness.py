@@ -0,0 +1,165 @@
+"""
+Minimal benchmark harness.
+
+Benchmarks are registered with `benchmark`. A benchmark returns either a
+callable, which is timed, or a measured value. Results are written to JSON
+and may be compared against a JSON baseline.
+
+Usage, from the repository root:
+
+    python -m benchmarks --save benchmarks/baseline.json
+    python -m benchmarks --compare benchmarks/baseline.json --threshold 0.25
+
+or `make benchmark` and `make benchmark-compare`. Timings depend on the
+machine, so the baseline is not committed: refresh it by saving results of
+the base revision on the same machine before comparing changes.
+"""
+
+import argparse
+import json
+import platform
+import sys
+import timeit
+from typing import Callable
+from typing import Dict
+
+BENCHMARKS: Dict[str, dict] = {}
+
+
+# --------------------------------------------------------------------------- #
+# Registration                                                                #
+# --------------------------------------------------------------------------- #
+
+
+def benchmark(name: str = None, unit: str = "s", requires: str = None):
+    """
+    Register a benchmark.
+
+    Parameters
+    ----------
+    name:
+        Benchmark name. Defaults to the function name.
+    unit:
+        Unit of measured values. Timed benchmarks are always in seconds per
+        call.
+    requires:
+        Module required to run the benchmark. Skipped if not installed.
+    """
+
+    def decorator(func: Callable) -> Callable:
+        BENCHMARKS[name or func.__name__] = {
+            "func": func,
+            "unit": unit,
+            "requires": requires,
+        }
+        return func
+
+    return decorator
+
+
+# --------------------------------------------------------------------------- #
+# Execution                                                                   #
+# --------------------------------------------------------------------------- #
+
+
+def _time(func: Callable, repeat: int) -> float:
+    timer = timeit.Timer(func)
+    number, _ = timer.autorange()
+    return min(timer.repeat(repeat=repeat, number=number)) / number
+
+
+def run(pattern: str = None, repeat: int = 5) -> dict:
+    results = {}
+    for name, b in BENCHMARKS.items():
+        if pattern and pattern not in name:
+            continue
+        if b["requires"]:
+            try:
+                __import__(b["requires"])
+            except ModuleNotFoundError:
+                print(f"{name:<40} skipped ({b['requires']} not installed)")
+                continue
+
+        value = b["func"]()
+        unit = b["unit"]
+        if callable(value):
+            value = _time(value, repeat)
+            unit = "s"
+        results[name] = {"value": value, "unit": unit}
+        print(f"{name:<40} {_format(value, unit)}")
+
+    return results
+
+
+def _format(value: float, unit: str) -> str:
+    if unit == "s":
+        for u, f in [("s", 1), ("ms", 1e-3), ("us", 1e-6)]:
+            if value >= f:
+                return f"{value / f:10.3f} {u}"
+        return f"{value / 1e-9:10.3f} ns"
+    if unit == "bytes":
+        return f"{value / 1024:10.1f} KiB"
+    return f"{value:10.3f} {unit}"
+
+
+def compare(results: dict, baseline: dict, threshold: float) -> list:
+    """
+    Return the benchmarks slower (or larger) than their baseline by more than
+    `threshold`, as a relative increase.
+    """
+    regressions = []
+    for name, r in results.items():
+        b = baseline["results"].get(name)
+        if b is None or b["value"] <= 0:
+            continue
+        ratio = r["value"] / b["value"]
+        flag = ""
+        if ratio > 1 + threshold:
+            regressions += [name]
+            flag = "  REGRESSION"
+        print(f"{name:<40} {ratio:6.2f}x baseline{flag}")
+    return regressions
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Run planck benchmarks.")
+    parser.add_argument("-k", dest="pattern", help="Only run matching benchmarks")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--save", help="Write results to a JSON file")
+    parser.add_argument("--compare", help="JSON baseline to compare against")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.25,
+        help="Relative increase over the baseline considered as a regression",
+    )
+    args = parser.parse_args(argv)
+
+    results = run(pattern=args.pattern, repeat=args.repeat)
+
+    if args.save:
+        import planck
+
+        with open(args.save, "w") as fp:
+            json.dump(
+                {
+                    "planck": planck.__version__,
+                    "python": sys.version.split()[0],
+                    "gil": getattr(sys, "_is_gil_enabled", lambda: True)(),
+                    "machine": platform.platform(),
+                    "results": results,
+                },
+                fp,
+                indent=4,
+            )
+
+    if args.compare:
+        with open(args.compare) as fp:
+            baseline = json.load(fp)
+        print()
+        regressions = compare(results, baseline, args.threshold)
+        if regressions:
+            print(f"\n{len(regressions)} regression(s): {', '.join(regressions)}")
+            return 1
+
+    return 0
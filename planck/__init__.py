@@ -1,3 +1,6 @@
+import sys
+import types
+
 from ._version import VERSION
 
 __version__ = VERSION
@@ -17,6 +20,45 @@ import planck.models
 # Objects                                                                     #
 # --------------------------------------------------------------------------- #
 
-from .constants import constants
-from .units import units
 from ._scipy import sp_constants
+
+# Libraries are only built when first accessed, as `planck.units` and
+# `planck.constants`. They share their name with the module defining them.
+_LIBRARIES = {
+    "units": "planck.units",
+    "constants": "planck.constants",
+}
+
+
+# Opt-in instrumentation functions, imported when first accessed
+_FUNCTIONS = {
+    "profile": "planck._stats",
+    "stats": "planck._stats",
+}
+
+
+def __getattr__(name):
+    module = _LIBRARIES.get(name) or _FUNCTIONS.get(name)
+    if module is None:
+        raise AttributeError(f"module 'planck' has no attribute '{name}'")
+    import importlib
+
+    obj = getattr(importlib.import_module(module), name)
+    globals()[name] = obj
+    return obj
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LIBRARIES) | set(_FUNCTIONS))
+
+
+class _Module(types.ModuleType):
+    def __setattr__(self, name, value):
+        # Importing `planck.units` or `planck.constants` binds the module to
+        # the package attribute. Keep resolving the library object instead.
+        if name in _LIBRARIES and isinstance(value, types.ModuleType):
+            return
+        super().__setattr__(name, value)
+
+
+sys.modules[__name__].__class__ = _Module
@@ -1,3 +1,8 @@
+import functools
+from typing import Optional
+from typing import Tuple
+
+
 # --------------------------------------------------------------------------- #
 #                                                                             #
 # International System Prefix                                                 #
@@ -30,6 +35,38 @@ si_prefixes = {
 }
 
 
+# --------------------------------------------------------------------------- #
+#                                                                             #
+# International System Base Units                                             #
+# ref: https://en.wikipedia.org/wiki/SI_base_unit                             #
+#                                                                             #
+# --------------------------------------------------------------------------- #
+
+# Dimensions of the exponent vectors. Angle is kept distinct from
+# dimensionless quantities to avoid equating hertz and radians per second.
+dimensions = [
+    "length",
+    "mass",
+    "time",
+    "temperature",
+    "amount of substance",
+    "electric current",
+    "luminous intensity",
+    "angle",
+]
+
+si_base_units = {
+    "m": "length",
+    "kg": "mass",
+    "s": "time",
+    "K": "temperature",
+    "mol": "amount of substance",
+    "A": "electric current",
+    "cd": "luminous intensity",
+    "rad": "angle",
+}
+
+
 # Units with prefixes
 units_with_prefixes = {
     "m": "metre",
@@ -46,9 +83,6 @@ units_with_prefixes = {
     "Pa": "pascal",
     "K": "kelvin",
 }
-for k in list(units_with_prefixes.keys()):
-    for p in si_prefixes.keys():
-        units_with_prefixes[p + k] = si_prefixes[p][1] + units_with_prefixes[k]
 
 # Other units
 unit_without_prefixes = {
@@ -73,6 +107,67 @@ unit_without_prefixes = {
 
 all_units = dict(units_with_prefixes, **unit_without_prefixes)
 
+
+# --------------------------------------------------------------------------- #
+# Prefix Resolution                                                           #
+# --------------------------------------------------------------------------- #
+
+
+def _build_prefix_trie(prefixes) -> dict:
+    trie = {}
+    for p in prefixes:
+        if p == "":
+            continue
+        node = trie
+        for c in p:
+            node = node.setdefault(c, {})
+        node[None] = p
+    return trie
+
+
+_prefix_trie = _build_prefix_trie(si_prefixes)
+
+
+@functools.lru_cache(maxsize=1024)
+def split_prefix(symbol: str) -> Optional[Tuple[str, str]]:
+    """
+    Split a symbol into an SI prefix and a unit supporting prefixes, such as
+    `"GW"` into `("G", "W")`. Unprefixed units are returned with an empty
+    prefix. Returns `None` if the symbol is not a (prefixed) unit supporting
+    prefixes.
+    """
+    if symbol in units_with_prefixes:
+        return "", symbol
+
+    # Walk the trie, then try the longest prefixes first ("da" before "d")
+    candidates = []
+    node = _prefix_trie
+    for c in symbol:
+        node = node.get(c)
+        if node is None:
+            break
+        if None in node:
+            candidates += [node[None]]
+
+    for p in reversed(candidates):
+        if symbol[len(p) :] in units_with_prefixes:
+            return p, symbol[len(p) :]
+
+    return None
+
+
+def unit_name(symbol: str) -> Optional[str]:
+    """
+    Name of a unit, including SI prefixed units, such as `"gigawatt"`.
+    """
+    name = all_units.get(symbol)
+    if name is None:
+        split = split_prefix(symbol)
+        if split is not None:
+            name = si_prefixes[split[0]][1] + units_with_prefixes[split[1]]
+    return name
+
+
 shortcuts = {
     "1/min": "rpm",
     "lb/in2": "psi",
@@ -0,0 +1,189 @@
+import math
+import mmap
+import os
+from typing import List
+from typing import Tuple
+from typing import TYPE_CHECKING
+
+from planck.backends import import_numpy
+from planck.models.converter import Converter
+
+if TYPE_CHECKING:
+    import numpy as np
+
+# Default number of records mapped at once
+CHUNK_SIZE = 1_048_576
+
+NPY_MAGIC = b"\x93NUMPY"
+
+
+def _require_numpy():
+    np = import_numpy()
+    if np is None:
+        raise ModuleNotFoundError("File conversions require numpy.")
+    return np
+
+
+def _is_npy(path) -> bool:
+    with open(path, "rb") as fp:
+        return fp.read(len(NPY_MAGIC)) == NPY_MAGIC
+
+
+# --------------------------------------------------------------------------- #
+# Layout                                                                      #
+# --------------------------------------------------------------------------- #
+
+
+def layout(np, path, dtype=None) -> Tuple["np.dtype", int, int, tuple, bool]:
+    """
+    Data type, offset of the data, number of records, shape and Fortran
+    order flag of a raw binary or `.npy` file.
+    """
+    if _is_npy(path):
+        # The header is parsed by NumPy. Mapping the file reads no data.
+        array = np.lib.format.open_memmap(path, mode="r")
+        info = (array.dtype, array.offset, array.size, array.shape)
+        fortran = array.ndim > 1 and not array.flags.c_contiguous
+        del array
+        if dtype is not None and np.dtype(dtype) != info[0]:
+            raise ValueError(f"{path} stores {info[0]} values, not {dtype}.")
+        return info + (fortran,)
+
+    dtype = np.dtype("float64" if dtype is None else dtype)
+    size = os.path.getsize(path)
+    if size % dtype.itemsize:
+        raise ValueError(f"Size of {path} is not a multiple of {dtype} size.")
+    n = size // dtype.itemsize
+    return dtype, 0, n, (n,), False
+
+
+def _chunk_records(dtype, chunk_size: int) -> int:
+    # Chunks span whole pages, so that each mapping is page-aligned
+    if chunk_size < 1:
+        raise ValueError("`chunk_size` must be strictly positive.")
+    step = mmap.PAGESIZE // math.gcd(mmap.PAGESIZE, dtype.itemsize)
+    return max(step, chunk_size // step * step)
+
+
+def _fields(dtype, fields: List[str]) -> List[str]:
+    if dtype.names is None:
+        if fields is not None:
+            raise ValueError(f"Fields {fields} given for unstructured {dtype}.")
+        if dtype.kind != "f":
+            raise TypeError(f"Only floating point values are converted, not {dtype}.")
+        return None
+
+    if fields is None:
+        raise ValueError("Fields to convert are required for structured data types.")
+    for f in fields:
+        if f not in dtype.names:
+            raise KeyError(f"Field {f} not found in {dtype}.")
+        if dtype[f].base.kind != "f":
+            raise TypeError(f"Field {f} is not a floating point field.")
+    return list(fields)
+
+
+def _convert_chunk(converter: Converter, source, destination, fields) -> None:
+    if fields is None:
+        converter(source, out=destination)
+        return
+    if destination is not source:
+        destination[...] = source
+    for f in fields:
+        converter(destination[f], inplace=True)
+
+
+# --------------------------------------------------------------------------- #
+# Conversions                                                                 #
+# --------------------------------------------------------------------------- #
+
+
+def convert_file(
+    converter: Converter,
+    source,
+    destination,
+    dtype=None,
+    fields: List[str] = None,
+    chunk_size: int = None,
+) -> int:
+    """
+    Convert a raw binary or `.npy` file into `destination`, mapping
+    `chunk_size` records of each file at a time. `.npy` files are written
+    with the header of the source. A destination that is the source file
+    itself is converted in place. Returns the number of records.
+    """
+    if os.path.exists(destination) and os.path.samefile(source, destination):
+        # Opening the destination for writing would truncate the source
+        return convert_file_inplace(converter, source, dtype, fields, chunk_size)
+
+    np = _require_numpy()
+    dtype, offset, n, shape, fortran = layout(np, source, dtype)
+    fields = _fields(dtype, fields)
+    rows = _chunk_records(dtype, CHUNK_SIZE if chunk_size is None else chunk_size)
+
+    # Output file allocated at full size, without writing any data
+    if offset:
+        out = np.lib.format.open_memmap(
+            destination, mode="w+", dtype=dtype, shape=shape, fortran_order=fortran
+        )
+        out_offset = out.offset
+        del out
+    else:
+        out_offset = 0
+        with open(destination, "wb") as fp:
+            fp.truncate(n * dtype.itemsize)
+
+    for start in range(0, n, rows):
+        count = min(rows, n - start)
+        x = np.memmap(
+            source,
+            dtype=dtype,
+            mode="r",
+            offset=offset + start * dtype.itemsize,
+            shape=(count,),
+        )
+        y = np.memmap(
+            destination,
+            dtype=dtype,
+            mode="r+",
+            offset=out_offset + start * dtype.itemsize,
+            shape=(count,),
+        )
+        _convert_chunk(converter, x, y, fields)
+        y.flush()
+        # Unmapped once converted: resident memory is bounded by the chunk
+        del x, y
+
+    return n
+
+
+def convert_file_inplace(
+    converter: Converter,
+    path,
+    dtype=None,
+    fields: List[str] = None,
+    chunk_size: int = None,
+) -> int:
+    """
+    Convert a raw binary or `.npy` file in place, mapping `chunk_size`
+    records at a time. Returns the number of records.
+    """
+    np = _require_numpy()
+    dtype, offset, n, _, _ = layout(np, path, dtype)
+    fields = _fields(dtype, fields)
+    rows = _chunk_records(dtype, CHUNK_SIZE if chunk_size is None else chunk_size)
+
+    for start in range(0, n, rows):
+        count = min(rows, n - start)
+        x = np.memmap(
+            path,
+            dtype=dtype,
+            mode="r+",
+            offset=offset + start * dtype.itemsize,
+            shape=(count,),
+        )
+        _convert_chunk(converter, x, x, fields)
+        x.flush()
+        del x
+
+    return n
@@ -0,0 +1,82 @@
+from typing import Dict
+from typing import List
+
+from planck.models.converter import Converter
+
+# --------------------------------------------------------------------------- #
+# Pandas                                                                      #
+# --------------------------------------------------------------------------- #
+
+
+def convert_pandas(frame, converters: Dict[str, Converter]):
+    """
+    Convert pandas DataFrame columns. Columns sharing the same conversion are
+    converted together, as a single block operation.
+    """
+    missing = [c for c in converters if c not in frame.columns]
+    if missing:
+        raise KeyError(f"Columns {missing} not found.")
+
+    # Group columns by conversion
+    groups: Dict[tuple, List[str]] = {}
+    for c, conv in converters.items():
+        groups.setdefault((conv.scale, conv.offset), []).append(c)
+
+    result = frame.copy(deep=False)
+    for (scale, offset), columns in groups.items():
+        block = frame[columns] * scale
+        if offset:
+            block = block + offset
+        result[columns] = block
+
+    return result
+
+
+# --------------------------------------------------------------------------- #
+# Arrow                                                                       #
+# --------------------------------------------------------------------------- #
+
+
+def convert_arrow(table, converters: Dict[str, Converter]):
+    """
+    Convert pyarrow Table columns with `pyarrow.compute` kernels. Nulls,
+    chunks, floating point types (including half floats, converted in float32)
+    and field metadata are preserved.
+    """
+    import pyarrow as pa
+    import pyarrow.compute as pc
+
+    for c, conv in converters.items():
+        i = table.schema.get_field_index(c)
+        if i < 0:
+            raise KeyError(f"Column '{c}' not found.")
+        field = table.schema.field(i)
+        column = table.column(i)
+
+        # Scalars are typed to avoid promoting float32 columns to float64
+        dtype = field.type
+        if not pa.types.is_floating(dtype):
+            dtype = pa.float64()
+            column = pc.cast(column, dtype)
+        elif pa.types.is_float16(dtype):
+            # Arrow has no float16 arithmetic kernels
+            dtype = pa.float32()
+            column = pc.cast(column, dtype)
+
+        # Chunks are converted one by one to keep the original chunking
+        scale = pa.scalar(conv.scale, dtype)
+        offset = pa.scalar(conv.offset, dtype)
+        chunks = []
+        for chunk in column.chunks:
+            chunk = pc.multiply(chunk, scale)
+            if conv.offset:
+                chunk = pc.add(chunk, offset)
+            chunks += [chunk]
+        column = pa.chunked_array(chunks, type=dtype)
+        if dtype != field.type and pa.types.is_floating(field.type):
+            dtype = field.type
+            column = pc.cast(column, dtype)
+
+        table = table.set_column(i, field.with_type(dtype), column)
+
+    return table
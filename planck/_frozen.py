@@ -0,0 +1,92 @@
+import threading
+
+
+def _restore(cls, items: dict, state: dict):
+    # Entries are restored as is, without the checks of `__setitem__`
+    library = cls.__new__(cls)
+    dict.update(library, items)
+    library.__setstate__(state)
+    return library
+
+
+# --------------------------------------------------------------------------- #
+# Main Class                                                                  #
+# --------------------------------------------------------------------------- #
+
+
+class FreezableLibrary(dict):
+    """
+    Library that may be frozen into a read-only mode, safe to share between
+    threads. Reads of memoized entries are plain dict lookups, without any
+    lock. Entries resolved on demand are built under a lock and published
+    once, so that every thread gets the same object.
+    """
+
+    _frozen = False
+
+    def __init__(self, *args, **kwargs):
+        self._lock = threading.RLock()
+        super().__init__(*args, **kwargs)
+
+    @property
+    def frozen(self) -> bool:
+        """`True` if the library is read-only"""
+        return self._frozen
+
+    def freeze(self):
+        """
+        Make the library read-only. Lazily built indexes are built right away.
+
+        Returns
+        -------
+        :
+            The library itself
+        """
+        self._prepare()
+        self._frozen = True
+        return self
+
+    def _prepare(self) -> None:
+        pass
+
+    # Locks can't be pickled: they are dropped and recreated
+    def __getstate__(self) -> dict:
+        state = dict(vars(self))
+        del state["_lock"]
+        return state
+
+    def __setstate__(self, state: dict) -> None:
+        vars(self).update(state)
+        self._lock = threading.RLock()
+
+    def __reduce__(self):
+        return _restore, (type(self), dict(self), self.__getstate__())
+
+    def _check_frozen(self) -> None:
+        if self._frozen:
+            raise TypeError(f"{type(self).__name__} library is frozen.")
+
+    def _publish(self, key, value):
+        # Publish an entry resolved on demand, keeping the first one if
+        # another thread published it meanwhile.
+        return super().setdefault(key, value)
+
+    def __delitem__(self, key):
+        self._check_frozen()
+        super().__delitem__(key)
+
+    def pop(self, *args):
+        self._check_frozen()
+        return super().pop(*args)
+
+    def popitem(self):
+        self._check_frozen()
+        return super().popitem()
+
+    def clear(self):
+        self._check_frozen()
+        super().clear()
+
+    def setdefault(self, key, default=None):
+        self._check_frozen()
+        return super().setdefault(key, default)
@@ -0,0 +1,93 @@
+import threading
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from concurrent.futures import ThreadPoolExecutor
+
+# Values converted at once by a worker thread: 512 KiB of float64, which fits
+# in the L2 cache together with the output block.
+CHUNK_SIZE = 65536
+
+_executors = {}
+_lock = threading.Lock()
+
+
+def get_executor(workers: int) -> "ThreadPoolExecutor":
+    """
+    Thread pool of `workers` threads, created once and reused by all
+    conversions.
+    """
+    executor = _executors.get(workers)
+    if executor is None:
+        with _lock:
+            executor = _executors.get(workers)
+            if executor is None:
+                from concurrent.futures import ThreadPoolExecutor
+
+                executor = ThreadPoolExecutor(workers, thread_name_prefix="planck")
+                _executors[workers] = executor
+    return executor
+
+
+# --------------------------------------------------------------------------- #
+# Chunked Conversions                                                         #
+# --------------------------------------------------------------------------- #
+
+
+def affine(
+    np,
+    value,
+    scale: float,
+    offset: float = 0.0,
+    out=None,
+    dtype=None,
+    workers: int = 1,
+    chunk_size: int = None,
+):
+    """
+    Compute `scale * value + offset` for a NumPy array, split into blocks of
+    `chunk_size` values converted concurrently by `workers` threads. NumPy
+    releases the GIL in arithmetic kernels, so blocks are converted in
+    parallel. Results are written into a single preallocated array, with the
+    data type of a serial conversion.
+
+    Returns `None` if the output can't be split into independent blocks,
+    such as non-contiguous arrays.
+    """
+    if chunk_size is None:
+        chunk_size = CHUNK_SIZE
+    if chunk_size < 1:
+        raise ValueError("`chunk_size` must be strictly positive.")
+
+    if not value.flags.c_contiguous:
+        return None
+    if out is None:
+        # Data type resolved as for a serial conversion
+        kind = np.multiply(np.empty(0, value.dtype), scale, dtype=dtype).dtype
+        out = np.empty(value.shape, dtype=kind)
+    elif out.shape != value.shape:
+        raise ValueError(f"`out` shape {out.shape} does not match {value.shape}.")
+
+    if not out.flags.c_contiguous or (
+        out is not value and np.may_share_memory(value, out)
+    ):
+        # Blocks must be views of the output, written independently
+        return None
+    x = value.reshape(-1)
+    y = out.reshape(-1)
+
+    def convert(start):
+        stop = start + chunk_size
+        block = y[start:stop]
+        np.multiply(x[start:stop], scale, out=block, dtype=dtype)
+        if offset:
+            np.add(block, offset, out=block, dtype=dtype)
+
+    starts = range(0, x.size, chunk_size)
+    if workers == 1 or len(starts) == 1:
+        for start in starts:
+            convert(start)
+    else:
+        # Results are consumed to propagate errors
+        list(get_executor(workers).map(convert, starts))
+    return out
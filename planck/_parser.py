@@ -0,0 +1,65 @@
+import functools
+import re
+from typing import Tuple
+
+# Unit symbol with an optional integer exponent, such as "s2", "m^3" or "s^-1"
+_TERM = re.compile(r"^(?P<symbol>[A-Za-z_]+|1)(?:\^?(?P<exponent>-?\d+))?$")
+
+# Operator, optionally surrounded by whitespace, or whitespace alone
+_SEPARATOR = re.compile(r"\s*([*/])\s*|\s+")
+
+
+# --------------------------------------------------------------------------- #
+# Parser                                                                      #
+# --------------------------------------------------------------------------- #
+
+
+@functools.lru_cache(maxsize=1024)
+def parse(expression: str) -> Tuple[Tuple[str, int], ...]:
+    """
+    Parse a compound unit expression into a product of unit symbols raised to
+    integer exponents. Terms are separated by `*` or `/`, a `/` applying to the
+    following term only. Terms separated by whitespace only are multiplied.
+
+    Parameters
+    ----------
+    expression:
+        Unit expression, such as `"lb*ft/s2"` or `"kg/m/s^2"`
+
+    Returns
+    -------
+    :
+        Tuple of `(symbol, exponent)`, with repeated symbols combined and the
+        dimensionless `"1"` dropped.
+
+    Examples
+    --------
+    ```py
+    from planck._parser import parse
+
+    print(parse("lb*ft/s2"))
+    #> (('lb', 1), ('ft', 1), ('s', -2))
+    ```
+    """
+    terms = {}
+    sign = 1
+    for token in _SEPARATOR.split(expression.strip()):
+        # Whitespace alone separates terms as a multiplication
+        if token is None or token == "*":
+            sign = 1
+            continue
+        if token == "/":
+            sign = -1
+            continue
+
+        match = _TERM.match(token)
+        if match is None:
+            raise ValueError(f"Invalid unit expression '{expression}'.")
+
+        symbol = match.group("symbol")
+        if symbol == "1":
+            continue
+        exponent = int(match.group("exponent") or 1)
+        terms[symbol] = terms.get(symbol, 0) + sign * exponent
+
+    return tuple((k, v) for k, v in terms.items() if v != 0)
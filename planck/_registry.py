@@ -0,0 +1,107 @@
+import json
+import os
+import time
+from typing import Dict
+from typing import List
+from typing import Tuple
+
+from planck import _stats
+from planck._common import shortcuts
+from planck.models.dimensionalphysicalconstant import DimensionalPhysicalConstant
+from planck.models.nondimensionalphysicalconstant import NonDimensionalPhysicalConstant
+from planck.models.unit import Unit
+
+# Units and constants shipped with planck
+DEFINITIONS = os.path.join(os.path.dirname(__file__), "definitions.json")
+
+
+# --------------------------------------------------------------------------- #
+# Paths                                                                       #
+# --------------------------------------------------------------------------- #
+
+
+def definition_files() -> List[str]:
+    """
+    Definition files loaded when the libraries are built: the definitions
+    shipped with planck, followed by the files listed in the
+    `PLANCK_DEFINITIONS` environment variable (separated by `os.pathsep`).
+    """
+    paths = [DEFINITIONS]
+    for path in os.environ.get("PLANCK_DEFINITIONS", "").split(os.pathsep):
+        if path:
+            paths += [path]
+    return paths
+
+
+# --------------------------------------------------------------------------- #
+# Models                                                                      #
+# --------------------------------------------------------------------------- #
+
+
+def build(definitions: dict) -> Tuple[Dict[str, Unit], dict]:
+    """
+    Build unit and constant models from declarative definitions.
+    """
+    units = {}
+    for u in definitions.get("units", []):
+        try:
+            symbol = u["symbol"]
+            quantity = u["quantity"]
+        except KeyError as e:
+            raise ValueError(f"Unit definition {u} is missing {e}.") from None
+        dimension = u.get("dimension")
+        units[symbol] = Unit(
+            symbol=symbol,
+            quantity=quantity,
+            name=u.get("name"),
+            si_prefixes=list(u.get("si_prefixes", [])),
+            order=int(u.get("order", 1)),
+            values={k: float(v) for k, v in u.get("values", {}).items()},
+            dimension=None if dimension is None else tuple(int(v) for v in dimension),
+            scale=u.get("scale"),
+        )
+
+    constants = {}
+    for c in definitions.get("constants", []):
+        if "symbol" not in c or ("values" in c) == ("value" in c):
+            raise ValueError(
+                f"Constant definition {c} requires a symbol and either values or "
+                f"a value."
+            )
+        symbol = c["symbol"]
+        if "value" in c:
+            constants[symbol] = NonDimensionalPhysicalConstant(
+                symbol, c.get("name"), c["value"]
+            )
+            continue
+
+        # Shortcuts are resolved once, when loaded
+        values = {k: float(v) for k, v in c["values"].items()}
+        for k in c["values"]:
+            if k in shortcuts:
+                values[shortcuts[k]] = values[k]
+        constants[symbol] = DimensionalPhysicalConstant(symbol, c.get("name"), values)
+
+    return units, constants
+
+
+def load(path: str) -> Tuple[Dict[str, Unit], dict]:
+    """
+    Load the units and constants of a JSON definition file.
+
+    Parameters
+    ----------
+    path:
+        Path of the JSON definition file
+
+    Returns
+    -------
+    :
+        Units and constants models, by symbol
+    """
+    t0 = time.perf_counter()
+    with open(path, "rb") as fp:
+        definitions = json.load(fp)
+    models = build(definitions)
+    _stats.record_definitions(path, time.perf_counter() - t0)
+    return models
@@ -1,41 +1,25 @@
 import math
 
+from planck.backends import get_backend
+
 DEFAULT_PERIOD = "1d"
 
+TEMPERATURE_SCALES = {
+    "celsius": "c",
+    "c": "c",
+    "kelvin": "k",
+    "k": "k",
+    "fahrenheit": "f",
+    "f": "f",
+    "rankine": "r",
+    "r": "r",
+}
+
 
 # --------------------------------------------------------------------------- #
 # Main Class - scipy.constants mock                                           #
 # --------------------------------------------------------------------------- #
 
-class ArrayLike(list):
-
-    def __add__(self, other):
-        return ArrayLike([i + other for i in self])
-
-    def __sub__(self, other):
-        return ArrayLike([i - other for i in self])
-
-    def __mul__(self, other):
-        return ArrayLike([i * other for i in self])
-
-    def __truediv__(self, other):
-        return ArrayLike([i / other for i in self])
-
-    def to_list(self):
-        return [i for i in self]
-
-
-def asanyarray(val):
-    try:
-        import numpy as np
-        return np.asanyarray(val)
-    except ModuleNotFoundError:
-        if isinstance(val, (list, set, tuple)):
-            #TODO: Log performance low?
-            return ArrayLike(val)
-        else:
-            return val
-
 
 class ScipyConstants:
     def __init__(self):
@@ -65,7 +49,82 @@ class ScipyConstants:
         self.zero_Celsius = 273.15
         self.R = 8.314462618
 
-    def convert_temperature(self, val, old_scale, new_scale):
+        self._temperature_transforms = None
+
+    @property
+    def temperature_transforms(self) -> dict:
+        """
+        Affine transforms `(scale, offset)` for every pair of supported
+        temperature scale spellings, compiled on first access.
+        """
+        if self._temperature_transforms is None:
+            # Only needed once, to compute the transforms exactly
+            from fractions import Fraction
+
+            # Transforms to Kelvin, computed exactly and rounded once
+            zero = Fraction(self.zero_Celsius)
+            to_kelvin = {
+                "c": (Fraction(1), zero),
+                "k": (Fraction(1), Fraction(0)),
+                "f": (Fraction(5, 9), zero - Fraction(160, 9)),
+                "r": (Fraction(5, 9), Fraction(0)),
+            }
+            transforms = {}
+            for old, (s0, o0) in to_kelvin.items():
+                for new, (s1, o1) in to_kelvin.items():
+                    transforms[(old, new)] = (float(s0 / s1), float((o0 - o1) / s1))
+
+            # Supported spellings, such as 'celsius', 'Celsius', 'c' and 'C'
+            scales = dict(TEMPERATURE_SCALES)
+            scales.update({k.capitalize(): v for k, v in TEMPERATURE_SCALES.items()})
+            self._temperature_transforms = {
+                (k0, k1): transforms[(v0, v1)]
+                for k0, v0 in scales.items()
+                for k1, v1 in scales.items()
+            }
+
+        return self._temperature_transforms
+
+    def temperature_affine(self, old_scale, new_scale):
+        """
+        Affine transform `(scale, offset)` converting a temperature from
+        `old_scale` to `new_scale` as `scale * val + offset`.
+
+        Parameters
+        ----------
+        old_scale: str
+            Original scale among Celsius, Kelvin, Fahrenheit and Rankine.
+        new_scale: str
+            New scale among Celsius, Kelvin, Fahrenheit and Rankine.
+
+        Returns
+        -------
+        res : tuple
+            Scale and offset of the transform
+        """
+        transforms = self.temperature_transforms
+        try:
+            return transforms[(old_scale, new_scale)]
+        except KeyError:
+            pass
+
+        old = TEMPERATURE_SCALES.get(old_scale.lower())
+        if old is None:
+            raise NotImplementedError(
+                "%s scale is unsupported: supported scales "
+                "are Celsius, Kelvin, Fahrenheit, and "
+                "Rankine" % old_scale
+            )
+        new = TEMPERATURE_SCALES.get(new_scale.lower())
+        if new is None:
+            raise NotImplementedError(
+                "'%s' scale is unsupported: supported "
+                "scales are 'Celsius', 'Kelvin', "
+                "'Fahrenheit', and 'Rankine'" % new_scale
+            )
+        return transforms[(old, new)]
+
+    def convert_temperature(self, val, old_scale, new_scale, out=None):
         """
         Convert from a temperature scale to another one among Celsius, Kelvin,
         Fahrenheit, and Rankine scales.
@@ -90,46 +149,24 @@ class ScipyConstants:
             Fahrenheit ('Fahrenheit', 'fahrenheit', 'F' or 'f'), and Rankine
             ('Rankine', 'rankine', 'R', 'r').
 
+        out : array_like, optional
+            Array in which the result is written, avoiding the allocation of a
+            new array. May be `val` itself.
+
         Returns
         -------
         res : float or array of floats
             Value(s) of the converted temperature(s) expressed in the new scale.
         """
-        # Convert from `old_scale` to Kelvin
-        if old_scale.lower() in ["celsius", "c"]:
-            tempo = asanyarray(val) + self.zero_Celsius
-        elif old_scale.lower() in ["kelvin", "k"]:
-            tempo = asanyarray(val)
-        elif old_scale.lower() in ["fahrenheit", "f"]:
-            tempo = (asanyarray(val) - 32) * 5 / 9 + self.zero_Celsius
-        elif old_scale.lower() in ["rankine", "r"]:
-            tempo = asanyarray(val) * 5 / 9
-        else:
-            raise NotImplementedError(
-                "%s scale is unsupported: supported scales "
-                "are Celsius, Kelvin, Fahrenheit, and "
-                "Rankine" % old_scale
-            )
-        # and from Kelvin to `new_scale`.
-        if new_scale.lower() in ["celsius", "c"]:
-            res = tempo - self.zero_Celsius
-        elif new_scale.lower() in ["kelvin", "k"]:
-            res = tempo
-        elif new_scale.lower() in ["fahrenheit", "f"]:
-            res = (tempo - self.zero_Celsius) * 9 / 5 + 32
-        elif new_scale.lower() in ["rankine", "r"]:
-            res = tempo * 9 / 5
-        else:
-            raise NotImplementedError(
-                "'%s' scale is unsupported: supported "
-                "scales are 'Celsius', 'Kelvin', "
-                "'Fahrenheit', and 'Rankine'" % new_scale
-            )
-
-        if isinstance(res, ArrayLike):
-            res = res.to_list()
-
-        return res
+        try:
+            scale, offset = self.temperature_transforms[(old_scale, new_scale)]
+        except KeyError:
+            scale, offset = self.temperature_affine(old_scale, new_scale)
+
+        # Single fused pass `scale * val + offset`
+        if out is None and isinstance(val, (int, float)):
+            return val * scale + offset
+        return get_backend(val).affine(val, scale, offset, out=out)
 
 
 sp_constants = ScipyConstants()
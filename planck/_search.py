@@ -0,0 +1,156 @@
+from typing import Dict
+from typing import Iterable
+from typing import Optional
+from typing import Tuple
+
+# Maximum number of memoized queries
+CACHE_SIZE = 4096
+
+
+def _ngrams(s: str, n: int) -> set:
+    return {s[i : i + n] for i in range(len(s) - n + 1)}
+
+
+def _trigrams(s: str) -> set:
+    # Padded, so that short strings and word boundaries are matched
+    return _ngrams(f"  {s.lower()} ", 3)
+
+
+# --------------------------------------------------------------------------- #
+# Main Class                                                                  #
+# --------------------------------------------------------------------------- #
+
+
+class SearchIndex:
+    def __init__(
+        self,
+        keys: Iterable[str],
+        quantities: Dict[str, str] = None,
+        names: Dict[str, str] = None,
+    ):
+        """
+        Search index of library keys, built once. Substring queries are
+        resolved from an index of the n-grams (up to trigrams) of the keys,
+        and fuzzy queries from the trigrams of the keys and of their names.
+        Results are memoized as sorted tuples.
+
+        Parameters
+        ----------
+        keys:
+            Library keys
+        quantities:
+            Quantity of each key
+        names:
+            Name of each key
+        """
+        if quantities is None:
+            quantities = {}
+        if names is None:
+            names = {}
+
+        self.keys = tuple(sorted(keys))
+
+        self.quantities = {}
+        for k in self.keys:
+            q = quantities.get(k)
+            if q is not None:
+                self.quantities.setdefault(q.lower(), []).append(k)
+        self.quantities = {q: tuple(v) for q, v in self.quantities.items()}
+
+        self.names = {}
+        for k in self.keys:
+            name = names.get(k)
+            if name:
+                self.names.setdefault(name.lower(), k)
+
+        # Substring index: 1 to 3-grams of keys
+        self.ngrams = {}
+        for k in self.keys:
+            for n in range(1, 4):
+                for g in _ngrams(k, n):
+                    self.ngrams.setdefault(g, set()).add(k)
+
+        # Fuzzy index: trigrams of keys and names
+        self.trigrams = {}
+        self.sizes = {}
+        for k in self.keys:
+            grams = _trigrams(k)
+            if names.get(k):
+                grams |= _trigrams(names[k])
+            self.sizes[k] = len(grams)
+            for g in grams:
+                self.trigrams.setdefault(g, set()).add(k)
+
+        self._cache = {}
+
+    def _memoize(self, key, result: tuple) -> tuple:
+        if len(self._cache) >= CACHE_SIZE:
+            self._cache.clear()
+        self._cache[key] = result
+        return result
+
+    def find(self, sub: str = None, quantity: str = None) -> Tuple[str, ...]:
+        """
+        Sorted keys containing `sub`, optionally restricted to `quantity`.
+        """
+        key = ("find", sub, quantity)
+        try:
+            return self._cache[key]
+        except KeyError:
+            pass
+
+        keys = self.keys
+        if quantity:
+            keys = self.quantities.get(quantity.lower(), ())
+
+        if sub:
+            if len(sub) <= 3:
+                candidates = self.ngrams.get(sub, set())
+            else:
+                postings = sorted(
+                    (self.ngrams.get(g, set()) for g in _ngrams(sub, 3)), key=len
+                )
+                candidates = {k for k in postings[0] if sub in k}
+            keys = tuple(k for k in keys if k in candidates)
+
+        return self._memoize(key, keys)
+
+    def fuzzy(
+        self, query: str, quantity: str = None, threshold: float = 0.2
+    ) -> Tuple[str, ...]:
+        """
+        Keys whose key or name is similar to `query`, best matches first.
+        Similarity is the Jaccard index of trigram sets.
+        """
+        key = ("fuzzy", query, quantity, threshold)
+        try:
+            return self._cache[key]
+        except KeyError:
+            pass
+
+        grams = _trigrams(query)
+        counts = {}
+        for g in grams:
+            for k in self.trigrams.get(g, ()):
+                counts[k] = counts.get(k, 0) + 1
+
+        allowed = None
+        if quantity:
+            allowed = set(self.quantities.get(quantity.lower(), ()))
+
+        scores = []
+        for k, c in counts.items():
+            if allowed is not None and k not in allowed:
+                continue
+            score = c / (len(grams) + self.sizes[k] - c)
+            if score >= threshold:
+                scores += [(-score, k)]
+        scores.sort()
+
+        return self._memoize(key, tuple(k for _, k in scores))
+
+    def key_from_name(self, name: str) -> Optional[str]:
+        """
+        Key of the entry named `name`, ignoring case.
+        """
+        return self.names.get(name.lower())
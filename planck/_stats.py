@@ -0,0 +1,280 @@
+import contextlib
+import functools
+import threading
+import time
+from typing import Iterator
+from typing import Tuple
+
+# Scalar conversions of a single pair of units from which values are likely
+# converted one by one in a loop, instead of as an array
+SCALAR_LOOP_CALLS = 1000
+
+# Size from which Python lists and tuples are slow to convert
+LARGE_SEQUENCE = 10_000
+
+_lock = threading.RLock()
+_depth = 0
+_patches = []
+
+_build = {}
+_definitions = {}
+_counters = None
+
+
+def _new_counters() -> dict:
+    return {
+        "conversions": {},
+        "temperature": {},
+        "constants": {},
+        "slow_paths": {},
+    }
+
+
+_counters = _new_counters()
+
+
+# --------------------------------------------------------------------------- #
+# Recording                                                                   #
+# --------------------------------------------------------------------------- #
+
+
+def record_build(name: str, seconds: float) -> None:
+    """
+    Record the build time of a library. Always recorded, as libraries are
+    only built once.
+    """
+    with _lock:
+        _build[name] = seconds
+
+
+def record_definitions(path: str, seconds: float) -> None:
+    """
+    Record the load time of a definition file.
+    """
+    with _lock:
+        _definitions[path] = {"time": seconds}
+
+
+def _size(value) -> Tuple[int, bool]:
+    # Number of elements, and whether value is a scalar
+    size = getattr(value, "size", None)
+    if isinstance(size, int):
+        return size, getattr(value, "ndim", 1) == 0
+    try:
+        return len(value), False
+    except TypeError:
+        return 1, True
+
+
+def _flag(kind: str, pair: tuple) -> None:
+    pairs = _counters["slow_paths"].setdefault(kind, {})
+    if pair not in pairs:
+        import logging
+
+        logging.getLogger("planck").info(
+            "Slow conversion path '%s' from %s to %s", kind, *pair
+        )
+    pairs[pair] = pairs.get(pair, 0) + 1
+
+
+def _record(section: str, pair: tuple, value, seconds: float) -> None:
+    from planck.backends import get_backend
+
+    n, scalar = _size(value)
+    python = not scalar and get_backend(value).name == "python"
+    with _lock:
+        entries = _counters[section]
+        entry = entries.get(pair)
+        if entry is None:
+            entry = entries[pair] = {
+                "calls": 0,
+                "elements": 0,
+                "time": 0.0,
+                "scalar_calls": 0,
+            }
+        entry["calls"] += 1
+        entry["elements"] += n
+        entry["time"] += seconds
+
+        if scalar:
+            entry["scalar_calls"] += 1
+            if entry["scalar_calls"] >= SCALAR_LOOP_CALLS:
+                _flag("scalar_loop", pair)
+        elif python:
+            _flag("python_backend", pair)
+        elif isinstance(value, (list, tuple)) and n >= LARGE_SEQUENCE:
+            _flag("large_sequence", pair)
+
+
+# --------------------------------------------------------------------------- #
+# Hooks                                                                       #
+# --------------------------------------------------------------------------- #
+
+
+def _convert_hook(convert):
+    from planck.units import _absolute_temperature
+
+    @functools.wraps(convert)
+    def wrapper(self, value, input_unit, output_unit, *args, **kwargs):
+        t0 = time.perf_counter()
+        result = convert(self, value, input_unit, output_unit, *args, **kwargs)
+        dt = time.perf_counter() - t0
+        pair = (input_unit, output_unit)
+        _record("conversions", pair, value, dt)
+        # Temperatures are converted with affine converters, not by
+        # `convert_temperature`
+        if _absolute_temperature(input_unit) or _absolute_temperature(output_unit):
+            _record("temperature", pair, value, dt)
+        return result
+
+    return wrapper
+
+
+def _temperature_hook(convert_temperature):
+    @functools.wraps(convert_temperature)
+    def wrapper(self, val, old_scale, new_scale, *args, **kwargs):
+        t0 = time.perf_counter()
+        result = convert_temperature(self, val, old_scale, new_scale, *args, **kwargs)
+        dt = time.perf_counter() - t0
+        _record("temperature", (old_scale, new_scale), val, dt)
+        return result
+
+    return wrapper
+
+
+def _lookup_hook(getitem):
+    @functools.wraps(getitem)
+    def wrapper(self, key):
+        with _lock:
+            lookups = _counters["constants"]
+            lookups[key] = lookups.get(key, 0) + 1
+        return getitem(self, key)
+
+    return wrapper
+
+
+def _targets() -> list:
+    from planck._scipy import ScipyConstants
+    from planck.constants import Constants
+    from planck.units import Units
+
+    return [
+        (Units, "convert", _convert_hook),
+        (ScipyConstants, "convert_temperature", _temperature_hook),
+        (Constants, "__getitem__", _lookup_hook),
+    ]
+
+
+def _install(targets: list) -> None:
+    # Hooks replace methods while profiling only: once removed, instrumented
+    # methods run without any overhead.
+    for cls, name, hook in targets:
+        _patches.append((cls, name, cls.__dict__.get(name)))
+        setattr(cls, name, hook(getattr(cls, name)))
+
+
+def _uninstall() -> None:
+    while _patches:
+        cls, name, original = _patches.pop()
+        if original is None:
+            delattr(cls, name)
+        else:
+            setattr(cls, name, original)
+
+
+# --------------------------------------------------------------------------- #
+# Public API                                                                  #
+# --------------------------------------------------------------------------- #
+
+
+def stats() -> dict:
+    """
+    Snapshot of the instrumentation counters. Conversions are only counted
+    while profiling, see `profile`.
+
+    Returns
+    -------
+    :
+        Mapping of:
+
+        - `enabled`: `True` while profiling
+        - `conversions`: `Units.convert` calls, converted elements, time [s]
+          and scalar calls, by `(input_unit, output_unit)` pair
+        - `temperature`: the same for temperature conversions, by
+          `Units.convert` or `sp_constants.convert_temperature`, by pair of
+          units or scales
+        - `constants`: number of lookups of each constant
+        - `slow_paths`: number of slow conversions by kind and pair. Kinds
+          are `python_backend` (pure Python conversion, without NumPy),
+          `large_sequence` (large Python list) and `scalar_loop` (many
+          scalar conversions of the same pair).
+        - `build`: build time [s] of the units and constants libraries, and
+          of the units index (`units_index`), built on first lookup
+        - `definitions`: load time [s] of each definition file
+
+    Examples
+    --------
+    ```py
+    import planck
+    from planck import units
+
+    with planck.profile() as snapshot:
+        for _ in range(3):
+            units.convert(1.0, "m", "ft")
+
+    print(snapshot["conversions"][("m", "ft")]["calls"])
+    #> 3
+    ```
+    """
+    import copy
+
+    with _lock:
+        snapshot = copy.deepcopy(_counters)
+        snapshot["enabled"] = _depth > 0
+        snapshot["build"] = dict(_build)
+        snapshot["definitions"] = copy.deepcopy(_definitions)
+    return snapshot
+
+
+def _reset() -> None:
+    global _counters
+    with _lock:
+        _counters = _new_counters()
+
+
+@contextlib.contextmanager
+def profile(reset: bool = True) -> Iterator[dict]:
+    """
+    Context manager enabling instrumentation. Counters are reset when
+    entering the outermost scope, and the snapshot of `stats` is written to
+    the yielded dictionary on exit. Scopes may be nested and used from
+    multiple threads: instrumentation is disabled when the last one exits.
+
+    Parameters
+    ----------
+    reset:
+        If `False`, counters of previous profiles are kept.
+
+    Returns
+    -------
+    :
+        Dictionary filled with the snapshot on exit
+    """
+    global _depth
+    targets = _targets()
+    with _lock:
+        if _depth == 0:
+            if reset:
+                _reset()
+            _install(targets)
+        _depth += 1
+
+    snapshot = {}
+    try:
+        yield snapshot
+    finally:
+        with _lock:
+            _depth -= 1
+            if _depth == 0:
+                _uninstall()
+        snapshot.update(stats())
@@ -0,0 +1,101 @@
+import array
+import csv
+import itertools
+import os
+from typing import Dict
+from typing import Iterable
+from typing import Iterator
+
+from planck.backends import import_numpy
+from planck.models.converter import Converter
+
+# --------------------------------------------------------------------------- #
+# Iterables                                                                   #
+# --------------------------------------------------------------------------- #
+
+
+def chunks(iterable: Iterable, chunk_size: int) -> Iterator:
+    """
+    Batch an iterable of numbers into float64 arrays of at most `chunk_size`
+    items, as NumPy arrays if installed and as `array.array` otherwise.
+    """
+    if chunk_size < 1:
+        raise ValueError("`chunk_size` must be strictly positive.")
+
+    np = import_numpy()
+    iterator = iter(iterable)
+    while True:
+        items = itertools.islice(iterator, chunk_size)
+        if np is not None:
+            chunk = np.fromiter(items, dtype=float, count=-1)
+        else:
+            chunk = array.array("d", items)
+        if len(chunk) == 0:
+            return
+        yield chunk
+
+
+def iconvert(converter: Converter, iterable: Iterable, chunk_size: int) -> Iterator:
+    for chunk in chunks(iterable, chunk_size):
+        # Chunks are owned by the generator and converted in place
+        yield from converter(chunk, inplace=True).tolist()
+
+
+# --------------------------------------------------------------------------- #
+# CSV                                                                         #
+# --------------------------------------------------------------------------- #
+
+
+def _open(file, mode):
+    if isinstance(file, (str, os.PathLike)):
+        return open(file, mode, newline=""), True
+    return file, False
+
+
+def convert_csv(
+    source,
+    destination,
+    converters: Dict[str, Converter],
+    chunk_size: int,
+    **fmtparams,
+) -> int:
+    """
+    Stream CSV rows from `source` to `destination`, converting columns
+    chunk by chunk. Empty cells are written unchanged. Returns the number of
+    rows written.
+    """
+    fin, close_in = _open(source, "r")
+    fout, close_out = _open(destination, "w")
+    try:
+        reader = csv.reader(fin, **fmtparams)
+        writer = csv.writer(fout, **fmtparams)
+
+        header = next(reader, None)
+        if header is None:
+            return 0
+        missing = [c for c in converters if c not in header]
+        if missing:
+            raise KeyError(f"Columns {missing} not found.")
+        columns = [(header.index(c), conv) for c, conv in converters.items()]
+        writer.writerow(header)
+
+        n = 0
+        while True:
+            rows = list(itertools.islice(reader, chunk_size))
+            if not rows:
+                return n
+            for i, conv in columns:
+                filled = [j for j, row in enumerate(rows) if row[i].strip() != ""]
+                if not filled:
+                    continue
+                items = (float(rows[j][i]) for j in filled)
+                values = next(chunks(items, len(filled)))
+                for j, v in zip(filled, conv(values, inplace=True).tolist()):
+                    rows[j][i] = repr(v)
+            writer.writerows(rows)
+            n += len(rows)
+    finally:
+        if close_in:
+            fin.close()
+        if close_out:
+            fout.close()
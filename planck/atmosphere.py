@@ -0,0 +1,185 @@
+import math
+from typing import NamedTuple
+from typing import Tuple
+from typing import Union
+from typing import TYPE_CHECKING
+
+from planck.backends import import_numpy
+
+if TYPE_CHECKING:
+    import numpy as np
+
+
+class Atmosphere(NamedTuple):
+    """
+    Atmospheric properties, in SI units.
+    """
+
+    temperature: Union[float, "np.array"]
+    """Temperature [K]"""
+
+    pressure: Union[float, "np.array"]
+    """Pressure [Pa]"""
+
+    density: Union[float, "np.array"]
+    """Density [kg/m3]"""
+
+    speed_of_sound: Union[float, "np.array"]
+    """Speed of sound [m/s]"""
+
+
+def _isa_constants() -> dict:
+    from planck import constants
+
+    # Memoized by the library, which resets them when constants change
+    c = constants._isa
+    if c is None:
+        c = constants._isa = _read_isa_constants(constants)
+    return c
+
+
+def _read_isa_constants(constants) -> dict:
+    return {
+        "T0": constants["isa_T0"]["K"],
+        "p0": constants["isa_p0"]["Pa"],
+        "lapse_rate": constants["isa_lapse_rate"]["degc/m"],
+        "alt_tropo": constants["isa_alt_tropo"]["m"],
+        "T_tropo": constants["isa_T_tropo"]["K"],
+        "Tc_tropo": constants["isa_Tc_tropo"]["1/m"],
+        "pc_tropo": float(constants["isa_pc_tropo"]),
+        "p_tropo": constants["isa_p_tropo"]["Pa"],
+        "R": constants["R_air"]["m2/s2/K"],
+        "gamma": float(constants["gamma_air"]),
+    }
+
+
+# --------------------------------------------------------------------------- #
+# ISA                                                                         #
+# --------------------------------------------------------------------------- #
+
+
+def _isa_scalar(h: float, c: dict) -> Atmosphere:
+    if h <= c["alt_tropo"]:
+        t = c["T0"] + c["lapse_rate"] * h
+        p = c["p0"] * (t / c["T0"]) ** c["pc_tropo"]
+    else:
+        t = c["T_tropo"]
+        p = c["p_tropo"] * math.exp(-c["Tc_tropo"] * (h - c["alt_tropo"]))
+    return Atmosphere(t, p, p / (c["R"] * t), math.sqrt(c["gamma"] * c["R"] * t))
+
+
+def _isa_array(np, h, c: dict, out: tuple) -> Atmosphere:
+    t, p, rho, a = out
+    tropo = h <= c["alt_tropo"]
+    strato = ~tropo
+
+    # Temperature
+    np.multiply(h, c["lapse_rate"], out=t)
+    np.add(t, c["T0"], out=t)
+    np.copyto(t, c["T_tropo"], where=strato)
+
+    # Pressure, each layer only evaluated where it applies
+    np.divide(t, c["T0"], out=p, where=tropo)
+    np.power(p, c["pc_tropo"], out=p, where=tropo)
+    np.multiply(p, c["p0"], out=p, where=tropo)
+    np.subtract(h, c["alt_tropo"], out=p, where=strato)
+    np.multiply(p, -c["Tc_tropo"], out=p, where=strato)
+    np.exp(p, out=p, where=strato)
+    np.multiply(p, c["p_tropo"], out=p, where=strato)
+
+    # Density and speed of sound. `a` may hold the altitude until now.
+    np.multiply(t, c["R"], out=rho)
+    np.divide(p, rho, out=rho)
+    np.multiply(t, c["gamma"] * c["R"], out=a)
+    np.sqrt(a, out=a)
+
+    return Atmosphere(t, p, rho, a)
+
+
+def isa(
+    altitude: Union[float, "np.array"],
+    unit: str = "ft",
+    out: Tuple["np.array", ...] = None,
+    dtype: "np.dtype" = None,
+) -> Atmosphere:
+    """
+    International Standard Atmosphere (ISA) properties at a given geopotential
+    altitude, computed from the `isa_*` constants. The troposphere and the
+    isothermal layer above the tropopause are modelled, which is valid up to
+    20 km.
+
+    Arrays are evaluated in a single pass: each layer is computed only where
+    it applies and results are written to `out` without any intermediate
+    array.
+
+    Parameters
+    ----------
+    altitude:
+        Geopotential altitude, as a scalar or a NumPy array
+    unit:
+        Altitude unit
+    out:
+        Arrays in which temperature, pressure, density and speed of sound are
+        written. Must have the shape of `altitude`.
+    dtype:
+        NumPy data type of the results, such as `float32`. Defaults to the
+        data type of `altitude` (`float32` for `float16`), or `float64` for
+        integers.
+
+    Returns
+    -------
+    :
+        Temperature [K], pressure [Pa], density [kg/m3] and speed of sound
+        [m/s]
+
+    Examples
+    --------
+    ```py
+    from planck import atmosphere
+
+    atm = atmosphere.isa(0.0)
+    print(atm.temperature, atm.pressure)
+    #> 288.15 101325.0
+    ```
+    """
+    from planck import units
+
+    converter = units.converter(unit, "m")
+    c = _isa_constants()
+
+    if isinstance(altitude, (int, float)) and out is None and dtype is None:
+        return _isa_scalar(converter.scale * altitude, c)
+
+    np = import_numpy()
+    if np is None:
+        raise ModuleNotFoundError("Altitude arrays require numpy.")
+
+    altitude = np.asarray(altitude)
+    if out is None:
+        if dtype is None:
+            # Half floats overflow: pressures are computed in float32 at least
+            dtype = (
+                np.promote_types(altitude.dtype, np.float32)
+                if altitude.dtype.kind == "f"
+                else np.float64
+            )
+        out = tuple(np.empty(altitude.shape, dtype=dtype) for _ in range(4))
+    elif len(out) != 4:
+        raise ValueError("`out` must hold 4 arrays.")
+
+    # The altitude in meters is stored in the speed of sound buffer until the
+    # last step. Altitudes already in meters and of the output type are used
+    # as is.
+    if (
+        converter.scale == 1.0
+        and altitude.dtype == out[3].dtype
+        and not any(np.shares_memory(altitude, v) for v in out)
+    ):
+        h = altitude
+    else:
+        h = np.multiply(altitude, converter.scale, out=out[3])
+
+    atm = _isa_array(np, h, c, out)
+    if atm.temperature.ndim == 0:
+        return Atmosphere(*(v[()] for v in atm))
+    return atm
@@ -0,0 +1,280 @@
+import array
+from typing import List
+
+# --------------------------------------------------------------------------- #
+# NumPy                                                                       #
+# --------------------------------------------------------------------------- #
+
+_numpy = None
+_numpy_resolved = False
+
+
+def import_numpy():
+    """
+    Return the `numpy` module if installed, `None` otherwise. The import is
+    only attempted once.
+    """
+    global _numpy, _numpy_resolved
+    if not _numpy_resolved:
+        try:
+            import numpy
+
+            _numpy = numpy
+        except ModuleNotFoundError:
+            _numpy = None
+        _numpy_resolved = True
+    return _numpy
+
+
+# --------------------------------------------------------------------------- #
+# Base Class                                                                  #
+# --------------------------------------------------------------------------- #
+
+
+class Backend:
+    """
+    Array backend applying unit conversions to a family of array types.
+    Backends are selected from the type of the converted value and the
+    selection is cached per type.
+    """
+
+    name = None
+
+    def supports(self, cls: type) -> bool:
+        """
+        Return `True` if values of type `cls` can be converted by the backend.
+
+        Parameters
+        ----------
+        cls:
+            Value type
+
+        Returns
+        -------
+        :
+            Support flag
+        """
+        raise NotImplementedError()
+
+    def affine(self, value, scale: float, offset: float = 0.0, out=None, dtype=None):
+        """
+        Compute `scale * value + offset`.
+
+        Parameters
+        ----------
+        value:
+            Values to convert
+        scale:
+            Conversion factor
+        offset:
+            Conversion offset
+        out:
+            Container in which the result is written. May be `value` itself.
+        dtype:
+            Data type of the result
+
+        Returns
+        -------
+        :
+            Converted values
+        """
+        raise NotImplementedError()
+
+
+# --------------------------------------------------------------------------- #
+# Backends                                                                    #
+# --------------------------------------------------------------------------- #
+
+
+class NumpyBackend(Backend):
+    """
+    NumPy arrays and scalars, as well as Python sequences and scalars when
+    NumPy is installed.
+    """
+
+    name = "numpy"
+
+    def __init__(self, np):
+        self.np = np
+
+    def supports(self, cls: type) -> bool:
+        np = self.np
+        return issubclass(cls, (np.ndarray, np.generic, list, tuple, int, float))
+
+    def affine(self, value, scale: float, offset: float = 0.0, out=None, dtype=None):
+        np = self.np
+        output = np.multiply(value, scale, out=out, dtype=dtype)
+        if offset:
+            # Offset is added in place, unless the output is a scalar
+            out = output if isinstance(output, np.ndarray) else None
+            output = np.add(output, offset, out=out, dtype=dtype)
+        return output
+
+
+class PythonBackend(Backend):
+    """
+    Python sequences, `array.array` and `memoryview` objects. Values are
+    converted in a single pass, without intermediate containers. Sequences are
+    returned as lists and buffers as `array.array`.
+    """
+
+    name = "python"
+
+    TYPECODES = {
+        "float32": "f",
+        "float64": "d",
+        "f": "f",
+        "d": "d",
+    }
+
+    def supports(self, cls: type) -> bool:
+        return issubclass(cls, (list, tuple, set, array.array, memoryview))
+
+    def affine(self, value, scale: float, offset: float = 0.0, out=None, dtype=None):
+        if out is not None:
+            if dtype is not None:
+                raise TypeError("`dtype` can't be combined with `out`.")
+            buffer = memoryview(out) if isinstance(out, array.array) else out
+            for i, v in enumerate(value):
+                buffer[i] = v * scale + offset
+            return out
+
+        if dtype is None and isinstance(value, (array.array, memoryview)):
+            typecode = (
+                value.typecode if isinstance(value, array.array) else value.format
+            )
+            dtype = typecode if typecode in ("f", "d") else "d"
+
+        if dtype is not None:
+            typecode = self.TYPECODES.get(str(dtype))
+            if typecode is None:
+                raise TypeError(f"dtype '{dtype}' is not supported without NumPy.")
+            # Preallocated and filled in place, without any intermediate list
+            output = array.array(typecode, [0.0]) * len(value)
+            return self.affine(value, scale, offset, out=output)
+
+        if offset:
+            return [v * scale + offset for v in value]
+        return [v * scale for v in value]
+
+
+class NativeBackend(Backend):
+    """
+    Any other object implementing arithmetic operators, such as Python
+    scalars, pandas series or CPU torch tensors. Values are converted with
+    their own operators, without any copy to NumPy.
+    """
+
+    name = "native"
+
+    def supports(self, cls: type) -> bool:
+        return hasattr(cls, "__mul__")
+
+    def affine(self, value, scale: float, offset: float = 0.0, out=None, dtype=None):
+        if out is not None:
+            if out is not value:
+                out[...] = value
+            out *= scale
+            if offset:
+                out += offset
+            output = out
+        else:
+            output = value * scale
+            if offset:
+                output = output + offset
+
+        if dtype is not None:
+            if not hasattr(output, "astype"):
+                raise TypeError(f"dtype is not supported for {type(value)}.")
+            output = output.astype(dtype)
+
+        return output
+
+
+# --------------------------------------------------------------------------- #
+# Registry                                                                    #
+# --------------------------------------------------------------------------- #
+
+_custom_backends = []
+_backends = None
+_cache = {}
+
+
+def _default_backends() -> List[Backend]:
+    backends = []
+    np = import_numpy()
+    if np is not None:
+        backends += [NumpyBackend(np)]
+    backends += [PythonBackend(), NativeBackend()]
+    return backends
+
+
+def get_backends() -> List[Backend]:
+    """
+    Return registered backends, in order of precedence. Default backends are
+    resolved on first use.
+
+    Returns
+    -------
+    :
+        List of backends
+    """
+    global _backends
+    if _backends is None:
+        _backends = _custom_backends + _default_backends()
+    return _backends
+
+
+def register_backend(backend: Backend) -> None:
+    """
+    Register an array backend. Registered backends take precedence over the
+    default ones.
+
+    Parameters
+    ----------
+    backend:
+        Array backend
+    """
+    global _backends
+    _custom_backends.insert(0, backend)
+    _backends = None
+    _cache.clear()
+
+
+def get_backend(value) -> Backend:
+    """
+    Return the backend converting `value`.
+
+    Parameters
+    ----------
+    value:
+        Values to convert
+
+    Returns
+    -------
+    :
+        Array backend
+
+    Examples
+    --------
+    ```py
+    import array
+
+    from planck import backends
+
+    print(backends.get_backend(array.array("d", [1.0, 2.0])).name)
+    #> python
+    ```
+    """
+    cls = type(value)
+    try:
+        return _cache[cls]
+    except KeyError:
+        pass
+
+    for backend in get_backends():
+        if backend.supports(cls):
+            _cache[cls] = backend
+            return backend
+
+    raise TypeError(f"No array backend supports values of type {cls}.")
@@ -0,0 +1,121 @@
+from typing import Dict
+from typing import Tuple
+from typing import TYPE_CHECKING
+
+from planck import _frames
+from planck.models.converter import Converter
+
+if TYPE_CHECKING:
+    import pyarrow as pa
+
+# --------------------------------------------------------------------------- #
+# Schema                                                                      #
+# --------------------------------------------------------------------------- #
+
+
+def _target_unit(library, unit: str, target: Dict[str, str]) -> str:
+    try:
+        quantity = library[unit].quantity
+    except KeyError:
+        quantity = None
+    if quantity in target:
+        return target[quantity]
+
+    # Compound expressions have no quantity: matched by dimension instead
+    for u in target.values():
+        try:
+            if library.compatible(unit, u):
+                return u
+        except (KeyError, ValueError):
+            continue
+    return None
+
+
+def _plan_schema(
+    schema: "pa.Schema", target: Dict[str, str], library, key: str
+) -> Tuple[Dict[str, Converter], "pa.Schema"]:
+    """
+    Converters of the columns with a unit in `target` quantities, and the
+    output schema with converted types and units.
+    """
+    import pyarrow as pa
+
+    converters = {}
+    fields = []
+    for field in schema:
+        metadata = field.metadata or {}
+        unit = metadata.get(key.encode())
+        output_unit = None
+        if unit is not None:
+            unit = unit.decode()
+            output_unit = _target_unit(library, unit, target)
+
+        if output_unit is not None:
+            converters[field.name] = library.converter(unit, output_unit)
+            if not pa.types.is_floating(field.type):
+                field = field.with_type(pa.float64())
+            metadata = {**metadata, key.encode(): output_unit.encode()}
+            field = field.with_metadata(metadata)
+        fields += [field]
+
+    return converters, pa.schema(fields, metadata=schema.metadata)
+
+
+# --------------------------------------------------------------------------- #
+# Parquet                                                                     #
+# --------------------------------------------------------------------------- #
+
+
+def convert_parquet(
+    source,
+    destination,
+    target: Dict[str, str],
+    key: str = "unit",
+    library=None,
+    **kwargs,
+) -> int:
+    """
+    Convert the columns of a Parquet file to target units, one row group at
+    a time. The unit of each column is read from its Arrow field metadata,
+    such as `{"unit": "ft"}`, and is rewritten with the target unit. Columns
+    are converted with `pyarrow.compute` kernels, so that only a single row
+    group is held in memory. Columns without unit, or whose quantity is not
+    in `target`, are written unchanged. Requires pyarrow.
+
+    Parameters
+    ----------
+    source:
+        Path or file object of the Parquet file to read
+    destination:
+        Path or file object of the Parquet file to write
+    target:
+        Mapping of quantities to target units, such as `{"length": "m"}`
+    key:
+        Field metadata key storing the unit of a column
+    library:
+        Units library resolving conversions. Defaults to `planck.units`.
+    kwargs:
+        Options of `pyarrow.parquet.ParquetWriter`, such as `compression`
+
+    Returns
+    -------
+    :
+        Number of rows written
+    """
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    if library is None:
+        from planck import units as library
+
+    reader = pq.ParquetFile(source)
+    converters, schema = _plan_schema(reader.schema_arrow, target, library, key)
+
+    rows = 0
+    with pq.ParquetWriter(destination, schema, **kwargs) as writer:
+        for i in range(reader.num_row_groups):
+            table = _frames.convert_arrow(reader.read_row_group(i), converters)
+            writer.write_table(pa.Table.from_arrays(table.columns, schema=schema))
+            rows += table.num_rows
+
+    return rows
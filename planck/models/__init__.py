@@ -1,3 +1,26 @@
 from planck.models.dimensionalphysicalconstant import DimensionalPhysicalConstant
 from planck.models.nondimensionalphysicalconstant import NonDimensionalPhysicalConstant
 from planck.models.unit import Unit
+from planck.models.unit import UnitView
+
+# Conversion models are only imported when first accessed
+_MODELS = {
+    "Converter": "planck.models.converter",
+    "Quantity": "planck.models.quantity",
+    "QuantityArray": "planck.models.quantity",
+}
+
+
+def __getattr__(name):
+    module = _MODELS.get(name)
+    if module is None:
+        raise AttributeError(f"module 'planck.models' has no attribute '{name}'")
+    import importlib
+
+    obj = getattr(importlib.import_module(module), name)
+    globals()[name] = obj
+    return obj
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_MODELS))
@@ -0,0 +1,193 @@
+from planck.backends import get_backend
+from planck.backends import import_numpy
+
+# --------------------------------------------------------------------------- #
+# Main Class                                                                  #
+# --------------------------------------------------------------------------- #
+
+
+class Converter:
+    __slots__ = ("input_unit", "output_unit", "scale", "offset")
+
+    def __init__(
+        self,
+        input_unit: str,
+        output_unit: str,
+        scale: float = 1.0,
+        offset: float = 0.0,
+    ):
+        """
+        Unit converter applying the affine transform `scale * value + offset`.
+        The transform is resolved once, typically with `Units.converter`, and
+        may be applied to any number of values.
+
+        Parameters
+        ----------
+        input_unit:
+            Source unit
+        output_unit:
+            Target unit
+        scale:
+            Conversion factor
+        offset:
+            Conversion offset. Only non-zero for temperatures.
+
+        Examples
+        --------
+        ```py
+        from planck import units
+
+        m_to_ft = units.converter("m", "ft")
+        print(m_to_ft(2.0))
+        #> 6.561679790026248
+
+        ft_to_km = units.converter("m", "km") @ m_to_ft.inverse
+        print(ft_to_km)
+        #> Converter(ft -> km): 0.0003048 * value
+        ```
+        """
+        self.input_unit = input_unit
+        self.output_unit = output_unit
+        self.scale = scale
+        self.offset = offset
+
+    def __call__(
+        self,
+        value,
+        out=None,
+        inplace: bool = False,
+        dtype=None,
+        workers: int = None,
+        chunk_size: int = None,
+    ):
+        if out is None and not inplace and dtype is None:
+            if isinstance(value, (int, float)):
+                return self.scalar(value)
+        return self.array(
+            value,
+            out=out,
+            inplace=inplace,
+            dtype=dtype,
+            workers=workers,
+            chunk_size=chunk_size,
+        )
+
+    def scalar(self, value: float) -> float:
+        """
+        Convert a single value, without any type check or array creation.
+
+        Parameters
+        ----------
+        value:
+            Value to convert
+
+        Returns
+        -------
+        :
+            Value expressed as `output_unit`
+        """
+        if self.offset:
+            return value * self.scale + self.offset
+        return value * self.scale
+
+    def array(
+        self,
+        value,
+        out=None,
+        inplace: bool = False,
+        dtype=None,
+        workers: int = None,
+        chunk_size: int = None,
+    ):
+        """
+        Convert an array-like value with the array backend matching its
+        type. See `planck.backends`.
+
+        Parameters
+        ----------
+        value:
+            Values to convert
+        out:
+            Array in which the result is written. Avoids allocating a new
+            array.
+        inplace:
+            If `True`, `value` is overwritten with the result.
+        dtype:
+            Data type of the result. By default, NumPy type promotion rules
+            apply.
+        workers:
+            Number of threads converting NumPy arrays, split into blocks of
+            `chunk_size` values. Other values are converted serially.
+        chunk_size:
+            Number of values converted at once by each thread
+
+        Returns
+        -------
+        :
+            Values expressed as `output_unit`
+        """
+        if inplace:
+            out = value
+        if workers is not None:
+            output = self._array_threads(value, out, dtype, workers, chunk_size)
+            if output is not None:
+                return output
+        return get_backend(value).affine(
+            value, self.scale, self.offset, out=out, dtype=dtype
+        )
+
+    def _array_threads(self, value, out, dtype, workers: int, chunk_size: int):
+        if workers < 1:
+            raise ValueError("`workers` must be strictly positive.")
+        np = import_numpy()
+        if np is None or not isinstance(value, np.ndarray) or value.ndim == 0:
+            return None
+        if out is not None and not isinstance(out, np.ndarray):
+            return None
+
+        # Thread pools are only imported when workers are requested
+        from planck import _parallel
+
+        return _parallel.affine(
+            np,
+            value,
+            self.scale,
+            self.offset,
+            out=out,
+            dtype=dtype,
+            workers=workers,
+            chunk_size=chunk_size,
+        )
+
+    @property
+    def inverse(self) -> "Converter":
+        """Converter from `output_unit` to `input_unit`"""
+        return Converter(
+            self.output_unit,
+            self.input_unit,
+            scale=1.0 / self.scale,
+            offset=-self.offset / self.scale,
+        )
+
+    def __matmul__(self, other: "Converter") -> "Converter":
+        # Composition: (self @ other)(value) == self(other(value))
+        if not isinstance(other, Converter):
+            return NotImplemented
+        if other.output_unit != self.input_unit:
+            raise ValueError(
+                f"Can't compose {self.input_unit} -> {self.output_unit} with "
+                f"{other.input_unit} -> {other.output_unit}."
+            )
+        return Converter(
+            other.input_unit,
+            self.output_unit,
+            scale=self.scale * other.scale,
+            offset=self.scale * other.offset + self.offset,
+        )
+
+    def __repr__(self):
+        s = f"Converter({self.input_unit} -> {self.output_unit}): "
+        s += f"{self.scale} * value"
+        if self.offset:
+            s += f" + {self.offset}"
+        return s
@@ -46,6 +46,15 @@ class DimensionalPhysicalConstant(dict):
         {'m/s2': 9.80665, 'ft/s2': 32.17404855643045}
         '''
         ```
+
+        Values in other units are converted from the declared values on first
+        access and cached, apart from the declared values.
+        ```py
+        from planck import constants
+
+        print(constants["earth_radius"]["mi"])
+        #> 3958.755865744055
+        ```
         """
         # Default mutable values
         if values is None:
@@ -54,6 +63,25 @@ class DimensionalPhysicalConstant(dict):
         super().__init__(values)
         self.symbol = symbol
         self.name = name
+        self._derived = {}
+
+    def __missing__(self, key):
+        # Derived values are cached apart from the declared ones
+        try:
+            return self._derived[key]
+        except KeyError:
+            pass
+
+        from planck import units
+
+        for unit, value in self.items():
+            try:
+                converter = units.converter(unit, key)
+            except (KeyError, ValueError, NotImplementedError):
+                continue
+            return self._derived.setdefault(key, converter(value))
+
+        raise KeyError(key)
 
     def __repr__(self, *args, **kwargs):
         s = ""
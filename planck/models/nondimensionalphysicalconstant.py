@@ -47,6 +47,9 @@ class NonDimensionalPhysicalConstant(float):
     def __new__(cls, symbol, name, value):
         return float.__new__(cls, value)
 
+    def __getnewargs__(self):
+        return self.symbol, self.name, float(self)
+
     def __repr__(self, *args, **kwargs):
         s = ""
         s += f"{self.name} [{self.symbol}]:\n"
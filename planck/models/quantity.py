@@ -0,0 +1,382 @@
+import operator
+
+from planck._parser import parse
+from planck.backends import import_numpy
+from planck.models.converter import Converter
+
+_MULTIPLICATIVE = {"multiply": 1, "divide": -1, "true_divide": -1}
+_ADDITIVE = {"add", "subtract", "maximum", "minimum", "fmax", "fmin"}
+_COMPARISONS = {
+    "equal",
+    "not_equal",
+    "less",
+    "less_equal",
+    "greater",
+    "greater_equal",
+}
+_SIGNS = {"negative", "positive", "absolute"}
+_TRIGONOMETRIC = {"sin", "cos", "tan"}
+
+
+def _units():
+    from planck import units
+
+    return units
+
+
+def _format(terms: dict) -> str:
+    num = [k if e == 1 else f"{k}{e}" for k, e in terms.items() if e > 0]
+    den = [k if e == -1 else f"{k}{-e}" for k, e in terms.items() if e < 0]
+    return "/".join(["*".join(num) or "1"] + den)
+
+
+def _product(unit0: str, unit1: str, sign: int = 1) -> str:
+    # Unit expression of unit0 * unit1 ** sign
+    terms = dict(parse(unit0))
+    for k, e in parse(unit1):
+        terms[k] = terms.get(k, 0) + sign * e
+    return _format({k: e for k, e in terms.items() if e != 0})
+
+
+def _power(unit: str, exponent: float) -> str:
+    terms = {}
+    for k, e in parse(unit):
+        e = e * exponent
+        if e != int(e):
+            raise ValueError(f"Can't raise '{unit}' to the power {exponent}.")
+        terms[k] = int(e)
+    return _format(terms)
+
+
+def _new(value, converter: Converter) -> "Quantity":
+    # Arrays are wrapped as QuantityArray, scalars as Quantity
+    cls = QuantityArray if getattr(value, "ndim", 0) else Quantity
+    q = object.__new__(cls)
+    q._value = value
+    q._converter = converter
+    return q
+
+
+# --------------------------------------------------------------------------- #
+# Operations                                                                  #
+# --------------------------------------------------------------------------- #
+
+
+def _multiply(q0, q1, sign: int) -> "Quantity":
+    if not isinstance(q0, Quantity):
+        if sign > 0:
+            return _multiply(q1, q0, sign)
+        # Plain value divided by a quantity
+        c = q1._linear()._converter
+        return _new(
+            q0 / q1._value,
+            Converter(
+                _power(c.input_unit, -1), _power(c.output_unit, -1), 1.0 / c.scale
+            ),
+        )
+
+    c0 = q0._linear()._converter
+    if not isinstance(q1, Quantity):
+        value = q0._value * q1 if sign > 0 else q0._value / q1
+        return _new(value, c0)
+
+    c1 = q1._linear()._converter
+    value = q0._value * q1._value if sign > 0 else q0._value / q1._value
+    return _new(
+        value,
+        Converter(
+            _product(c0.input_unit, c1.input_unit, sign),
+            _product(c0.output_unit, c1.output_unit, sign),
+            c0.scale * c1.scale**sign,
+        ),
+    )
+
+
+def _additive(op, q0, q1) -> "Quantity":
+    if not isinstance(q0, Quantity) or not isinstance(q1, Quantity):
+        raise TypeError("Quantities can only be combined with quantities.")
+
+    q1 = q1.to(q0.unit)
+    c0 = q0._converter
+    c1 = q1._converter
+    if c0.offset or c1.offset:
+        return _new(op(q0.value, q1.value), Converter(q0.unit, q0.unit))
+
+    # Both values share the pending conversion of the first one
+    ratio = c1.scale / c0.scale
+    value = q1._value * ratio if ratio != 1.0 else q1._value
+    return _new(op(q0._value, value), c0)
+
+
+def _compare(op, q0, q1):
+    # Left to the other operand: equality falls back to identity, and
+    # ordering raises a TypeError
+    if not isinstance(q0, Quantity) or not isinstance(q1, Quantity):
+        return NotImplemented
+    return op(q0.value, q1.to(q0.unit).value)
+
+
+def _raise(q, exponent: float) -> "Quantity":
+    c = q._linear()._converter
+    return _new(
+        q._value**exponent,
+        Converter(
+            _power(c.input_unit, exponent),
+            _power(c.output_unit, exponent),
+            c.scale**exponent,
+        ),
+    )
+
+
+def _unary(op, q) -> "Quantity":
+    # Conversion scales are positive, so sign operations commute with them
+    c = q._linear()._converter
+    return _new(op(q._value), c)
+
+
+# --------------------------------------------------------------------------- #
+# Main Class                                                                  #
+# --------------------------------------------------------------------------- #
+
+
+class Quantity:
+    __slots__ = ("_value", "_converter")
+
+    def __init__(self, value, unit: str):
+        """
+        Value carrying its unit. Units are tracked through arithmetic and
+        conversions are deferred: `to` only composes conversion factors and
+        values are converted once, when `value` is accessed.
+
+        Parameters
+        ----------
+        value:
+            Value expressed as `unit`
+        unit:
+            Unit symbol or expression, such as `"m"` or `"lb*ft/s2"`
+
+        Examples
+        --------
+        ```py
+        from planck import models
+
+        length = models.Quantity(2.0, "m")
+        time = models.Quantity(4.0, "s")
+
+        speed = (length / time).to("km/h")
+        print(speed)
+        #> 1.8 km/h
+        print(speed.to("ft/s").to("m/s").value)
+        #> 0.5
+        ```
+        """
+        self._value = value
+        self._converter = Converter(unit, unit)
+
+    # ----------------------------------------------------------------------- #
+    # Conversions                                                             #
+    # ----------------------------------------------------------------------- #
+
+    @property
+    def unit(self) -> str:
+        """Unit symbol or expression"""
+        return self._converter.output_unit
+
+    @property
+    def value(self):
+        """Value expressed as `unit`. Pending conversions are applied once."""
+        self._apply()
+        return self._value
+
+    def _apply(self) -> None:
+        # Apply the pending conversion, if any
+        c = self._converter
+        if c.scale != 1.0 or c.offset:
+            self._value = c(self._value)
+            self._converter = Converter(c.output_unit, c.output_unit)
+
+    @property
+    def dimension(self) -> tuple:
+        """Dimension exponents vector of `unit`. See `Units.dimension`."""
+        return _units().dimension(self.unit)
+
+    def to(self, unit: str) -> "Quantity":
+        """
+        Express the quantity as `unit`. The conversion is composed with any
+        pending one and no value is converted until `value` is accessed.
+
+        Parameters
+        ----------
+        unit:
+            Target unit
+
+        Returns
+        -------
+        :
+            Quantity expressed as `unit`
+        """
+        if unit == self.unit:
+            return self
+        converter = _units().converter(self.unit, unit) @ self._converter
+        return _new(self._value, converter)
+
+    def _linear(self) -> "Quantity":
+        """
+        Apply the pending conversion if it has an offset (temperatures).
+        Products and powers are only deferred for linear conversions.
+        """
+        if self._converter.offset:
+            self._apply()
+        return self
+
+    # ----------------------------------------------------------------------- #
+    # Arithmetic                                                              #
+    # ----------------------------------------------------------------------- #
+
+    def __mul__(self, other):
+        return _multiply(self, other, 1)
+
+    def __rmul__(self, other):
+        return _multiply(other, self, 1)
+
+    def __truediv__(self, other):
+        return _multiply(self, other, -1)
+
+    def __rtruediv__(self, other):
+        return _multiply(other, self, -1)
+
+    def __pow__(self, exponent):
+        return _raise(self, exponent)
+
+    def __add__(self, other):
+        return _additive(operator.add, self, other)
+
+    def __radd__(self, other):
+        return _additive(operator.add, other, self)
+
+    def __sub__(self, other):
+        return _additive(operator.sub, self, other)
+
+    def __rsub__(self, other):
+        return _additive(operator.sub, other, self)
+
+    def __neg__(self):
+        return _unary(operator.neg, self)
+
+    def __pos__(self):
+        return self
+
+    def __abs__(self):
+        return _unary(abs, self)
+
+    def __eq__(self, other):
+        return _compare(operator.eq, self, other)
+
+    def __ne__(self, other):
+        return _compare(operator.ne, self, other)
+
+    def __lt__(self, other):
+        return _compare(operator.lt, self, other)
+
+    def __le__(self, other):
+        return _compare(operator.le, self, other)
+
+    def __gt__(self, other):
+        return _compare(operator.gt, self, other)
+
+    def __ge__(self, other):
+        return _compare(operator.ge, self, other)
+
+    __hash__ = None
+
+    def __float__(self):
+        return float(self.value)
+
+    # ----------------------------------------------------------------------- #
+    # NumPy                                                                   #
+    # ----------------------------------------------------------------------- #
+
+    def __array_ufunc__(self, ufunc, method, *inputs, **kwargs):
+        name = ufunc.__name__
+        if any(isinstance(o, Quantity) for o in kwargs.get("out", ())):
+            return NotImplemented
+
+        if method == "reduce" and name == "add":
+            # Sums commute with linear conversions
+            q = inputs[0]._linear()
+            return _new(ufunc.reduce(q._value, **kwargs), q._converter)
+        if method != "__call__":
+            return NotImplemented
+
+        if name in _MULTIPLICATIVE:
+            return _multiply(*inputs, _MULTIPLICATIVE[name])
+        if name in _ADDITIVE:
+            return _additive(ufunc, *inputs)
+        if name in _COMPARISONS:
+            return _compare(ufunc, *inputs)
+        if name in _SIGNS:
+            return _unary(ufunc, inputs[0])
+        if name == "power" and not isinstance(inputs[1], Quantity):
+            return _raise(inputs[0], inputs[1])
+        if name == "square":
+            return _raise(inputs[0], 2)
+        if name == "sqrt":
+            return _raise(inputs[0], 0.5)
+        if name in _TRIGONOMETRIC:
+            return ufunc(inputs[0].to("rad").value, **kwargs)
+        return NotImplemented
+
+    def __repr__(self):
+        return f"{self.value} {self.unit}"
+
+
+class QuantityArray(Quantity):
+    __slots__ = ()
+
+    def __init__(self, value, unit: str, dtype=None):
+        """
+        NumPy array carrying its unit. Supports NumPy ufuncs, such as
+        `np.multiply` or `np.add`, with units tracked and conversions deferred
+        as for `Quantity`. Chained conversions are applied as a single
+        multiplication.
+
+        Parameters
+        ----------
+        value:
+            Values expressed as `unit`
+        unit:
+            Unit symbol or expression
+        dtype:
+            NumPy data type of the values
+        """
+        np = import_numpy()
+        if np is None:
+            raise ModuleNotFoundError("QuantityArray requires numpy.")
+        super().__init__(np.asarray(value, dtype=dtype), unit)
+
+    @property
+    def shape(self) -> tuple:
+        """Array shape"""
+        return self._value.shape
+
+    @property
+    def ndim(self) -> int:
+        """Number of array dimensions"""
+        return self._value.ndim
+
+    def __len__(self):
+        return len(self._value)
+
+    def __getitem__(self, key):
+        return _new(self._value[key], self._converter)
+
+    def __array__(self, dtype=None, copy=None):
+        value = self.value
+        if dtype is not None and dtype != value.dtype:
+            return value.astype(dtype)
+        if copy:
+            return value.copy()
+        return value
+
+    def __repr__(self):
+        return f"QuantityArray({self.value!r}, '{self.unit}')"
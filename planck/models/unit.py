@@ -1,26 +1,19 @@
-import re
+import array
+from collections.abc import Mapping
 from typing import Dict
+from typing import List
+from typing import Tuple
 
 from planck._common import si_prefixes
-from planck._common import all_units
+from planck._common import split_prefix
+from planck._common import unit_name
 
 
 def _split_symbol(symbol):
-    # Input validation
-    nd = len(symbol.split("/"))
-    nm = len(symbol.split("*"))
-    if nd > 1 or nm > 1:
-        raise TypeError("Multi-units are not supported.")
-
-    # Get prefix and base
-    p0 = ""
-    for p in si_prefixes.keys():
-        if p != "":
-            if re.match(p + r"\D{1}", symbol):
-                p0 = p
-    base = symbol.replace(p0, "", 1)
-
-    return p0, base
+    split = split_prefix(symbol)
+    if split is None:
+        return "", symbol
+    return split
 
 
 # --------------------------------------------------------------------------- #
@@ -37,6 +30,8 @@ class Unit(dict):
         si_prefixes: list = None,
         order: int = 1,
         values: Dict[str, float] = None,
+        dimension: Tuple[int, ...] = None,
+        scale: float = None,
     ):
         """
         Unit model
@@ -55,6 +50,14 @@ class Unit(dict):
             Order of the quantity
         values:
             Values expressed in other units
+        dimension:
+            Exponents of the SI base dimensions (length, mass, time,
+            temperature, amount of substance, electric current, luminous
+            intensity) and of angle. Inferred by the units library when
+            not specified.
+        scale:
+            Value of the unit expressed in SI base units. Inferred by the units
+            library when not specified.
 
         Examples
         --------
@@ -86,7 +89,7 @@ class Unit(dict):
         if si_prefixes is None:
             si_prefixes = []
         if name is None:
-            name = all_units.get(symbol)
+            name = unit_name(symbol)
 
         super().__init__(values)
 
@@ -95,6 +98,8 @@ class Unit(dict):
         self.name = name
         self.si_prefixes = si_prefixes
         self.order = order
+        self.dimension = dimension
+        self.scale = scale
 
         self.add_si_prefixes()
 
@@ -108,3 +113,153 @@ class Unit(dict):
         s += f"{self.name} [{self.symbol}] - unit of {self.quantity}:\n"
         s += super().__repr__(*args, **kwargs)
         return s
+
+
+# --------------------------------------------------------------------------- #
+# View                                                                        #
+# --------------------------------------------------------------------------- #
+
+
+class UnitView(Mapping):
+    __slots__ = (
+        "symbol",
+        "quantity",
+        "name",
+        "si_prefixes",
+        "order",
+        "dimension",
+        "scale",
+        "_refs",
+        "_factor",
+    )
+
+    def __init__(
+        self,
+        symbol: str,
+        quantity: str,
+        refs: List[Tuple["FactorGroup", float]],
+        factor: float = 1.0,
+        name: str = None,
+    ):
+        """
+        Read-only view of a unit resolved by the units library. Conversion
+        factors are not stored: `view[k]` is computed from the factor arrays
+        of the groups of units the unit belongs to. Supports the same
+        mapping interface and attributes as `Unit`.
+
+        Parameters
+        ----------
+        symbol:
+            Unit symbol
+        quantity:
+            Unit quantity
+        refs:
+            Groups the unit belongs to, with the factor of the unit within
+            each group, in order of precedence
+        factor:
+            Value of `symbol` expressed in the unit of the groups. Only
+            differs from 1 for SI prefixed units missing from all groups.
+        name:
+            Unit name
+        """
+        if name is None:
+            name = unit_name(symbol)
+        self.symbol = symbol
+        self.quantity = quantity
+        self.name = name
+        self.si_prefixes = []
+        self.order = 1
+        self.dimension = None
+        self.scale = None
+        self._refs = refs
+        self._factor = factor
+
+    def __getitem__(self, key: str) -> float:
+        if self._factor != 1.0 and key == self.symbol:
+            return 1.0
+        for group, f0 in self._refs:
+            i = group.index.get(key)
+            if i is not None:
+                return group.factors[i] / f0 * self._factor
+        raise KeyError(key)
+
+    def __contains__(self, key) -> bool:
+        if key == self.symbol:
+            return True
+        return any(key in group.index for group, _ in self._refs)
+
+    def __iter__(self):
+        keys = {self.symbol: None} if self._factor != 1.0 else {}
+        for group, _ in self._refs:
+            keys.update(dict.fromkeys(group.index))
+        return iter(keys)
+
+    def __len__(self):
+        return sum(1 for _ in self)
+
+    def __repr__(self):
+        s = ""
+        s += f"{self.name} [{self.symbol}] - unit of {self.quantity}:\n"
+        s += repr(dict(self))
+        return s
+
+
+class FactorGroup:
+    __slots__ = ("index", "factors")
+
+    def __init__(self, unit: Unit, aliases: Dict[str, str] = None):
+        """
+        Conversion factors of a defined unit to the units it is defined
+        with, stored as one contiguous array. Aliases share the index of the
+        unit they stand for.
+
+        Parameters
+        ----------
+        unit:
+            Unit definition
+        aliases:
+            Mapping of symbols to their alias, such as `"lb/in2"` to `"psi"`
+        """
+        if aliases is None:
+            aliases = {}
+        self.index = {}
+        self.factors = array.array("d")
+        for k, f in unit.items():
+            self.index[k] = len(self.factors)
+            self.factors.append(f)
+        for k in unit:
+            if k in aliases:
+                self.index[aliases[k]] = self.index[k]
+        if unit.symbol not in self.index:
+            self.index[unit.symbol] = len(self.factors)
+            self.factors.append(1.0)
+
+    @classmethod
+    def from_buffer(cls, index: Dict[str, int], factors) -> "FactorGroup":
+        """
+        Build a group from an existing index and factors buffer, such as a
+        view of shared memory, without copying the factors.
+
+        Parameters
+        ----------
+        index:
+            Mapping of symbols to their position in `factors`
+        factors:
+            Buffer of float64 factors, such as a memoryview cast to `"d"`
+        """
+        group = cls.__new__(cls)
+        group.index = index
+        group.factors = factors
+        return group
+
+    def __getitem__(self, key: str) -> float:
+        return self.factors[self.index[key]]
+
+    def __contains__(self, key) -> bool:
+        return key in self.index
+
+    def __iter__(self):
+        return iter(self.index)
+
+    def items(self):
+        return [(k, self.factors[i]) for k, i in self.index.items()]
@@ -0,0 +1,318 @@
+import array
+import marshal
+import os
+import struct
+import sys
+import weakref
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+from typing import Dict
+from typing import Tuple
+from typing import Union
+from typing import TYPE_CHECKING
+
+from planck._version import VERSION
+from planck.backends import import_numpy
+from planck.models.converter import Converter
+from planck.models.unit import FactorGroup
+from planck.models.unit import Unit
+
+if TYPE_CHECKING:
+    import numpy as np
+
+# Shared registry header. FORMAT is incremented when the layout changes.
+MAGIC = "planck-shared"
+FORMAT = 1
+
+# Length of the metadata, stored at the start of the shared registry
+_HEADER = struct.Struct("<Q")
+
+
+def _attach(name: str) -> shared_memory.SharedMemory:
+    # Only the process creating a block is responsible for unlinking it
+    if sys.version_info >= (3, 13):
+        return shared_memory.SharedMemory(name, track=False)
+    return shared_memory.SharedMemory(name)
+
+
+def _require_numpy():
+    np = import_numpy()
+    if np is None:
+        raise ModuleNotFoundError("Shared arrays require numpy.")
+    return np
+
+
+# --------------------------------------------------------------------------- #
+# Registry                                                                    #
+# --------------------------------------------------------------------------- #
+
+
+def export_registry(
+    definitions: Dict[str, Unit], groups: Dict[str, FactorGroup]
+) -> shared_memory.SharedMemory:
+    """
+    Copy defined units into a new shared memory block: a marshaled table of
+    unit metadata, followed by the factors of all groups as one contiguous
+    float64 buffer.
+    """
+    records = []
+    factors = array.array("d")
+    for k, u in definitions.items():
+        group = groups[k]
+        dimension = None if u.dimension is None else tuple(u.dimension)
+        records += [
+            (
+                k,
+                u.quantity,
+                u.name,
+                tuple(u.si_prefixes),
+                u.order,
+                dimension,
+                u.scale,
+                tuple(group.index.items()),
+                len(factors),
+                len(group.factors),
+            )
+        ]
+        factors.extend(group.factors)
+
+    meta = marshal.dumps((MAGIC, FORMAT, VERSION, records))
+    start = -(-(_HEADER.size + len(meta)) // 8) * 8
+    size = start + len(factors) * factors.itemsize
+
+    shm = shared_memory.SharedMemory(create=True, size=size)
+    _HEADER.pack_into(shm.buf, 0, len(meta))
+    shm.buf[_HEADER.size : _HEADER.size + len(meta)] = meta
+    shm.buf[start:size] = factors.tobytes()
+    return shm
+
+
+def _release(shm: shared_memory.SharedMemory, groups: list) -> None:
+    # Views of the block must be released before it can be closed
+    for group in groups:
+        group.factors.release()
+    shm.close()
+
+
+def attach_registry(
+    name: str,
+) -> Tuple[shared_memory.SharedMemory, Dict[str, Unit], Dict[str, FactorGroup]]:
+    """
+    Attach to a registry exported with `export_registry`. Factor groups are
+    views of the shared block: factors are not copied.
+    """
+    shm = _attach(name)
+    (n,) = _HEADER.unpack_from(shm.buf, 0)
+    header = marshal.loads(bytes(shm.buf[_HEADER.size : _HEADER.size + n]))
+    if header[:3] != (MAGIC, FORMAT, VERSION):
+        shm.close()
+        raise ValueError(f"Shared memory block {name} is not a planck registry.")
+    start = -(-(_HEADER.size + n) // 8) * 8
+
+    definitions = {}
+    groups = {}
+    for record in header[3]:
+        symbol, quantity, unit_name, prefixes, order, dim, scale = record[:7]
+        index, offset, size = record[7:]
+        definitions[symbol] = Unit(
+            symbol=symbol,
+            quantity=quantity,
+            name=unit_name,
+            si_prefixes=list(prefixes),
+            order=order,
+            dimension=dim,
+            scale=scale,
+        )
+        a = start + offset * 8
+        groups[symbol] = FactorGroup.from_buffer(
+            dict(index), shm.buf[a : a + size * 8].cast("d")
+        )
+
+    return shm, definitions, groups
+
+
+def keep_attached(library, shm: shared_memory.SharedMemory, groups: dict) -> None:
+    """
+    Keep `shm` open as long as `library` is alive.
+    """
+    library._shared = shm
+    weakref.finalize(library, _release, shm, list(groups.values()))
+
+
+# --------------------------------------------------------------------------- #
+# Arrays                                                                      #
+# --------------------------------------------------------------------------- #
+
+
+class SharedArray:
+    def __init__(
+        self,
+        shape: Union[int, Tuple[int, ...]],
+        dtype: "np.dtype" = "float64",
+        name: str = None,
+    ):
+        """
+        NumPy array stored in a `multiprocessing.shared_memory` block, which
+        other processes attach to by name without any copy. The process
+        creating the array owns the block and unlinks it when used as a
+        context manager.
+
+        Parameters
+        ----------
+        shape:
+            Array shape
+        dtype:
+            NumPy data type
+        name:
+            Name of an existing block to attach to. A new block is created
+            if not specified.
+        """
+        np = _require_numpy()
+        if isinstance(shape, int):
+            shape = (shape,)
+        self.shape = tuple(shape)
+        self.dtype = np.dtype(dtype)
+        self.owner = name is None
+
+        size = self.dtype.itemsize
+        for n in self.shape:
+            size *= n
+        if self.owner:
+            self._shm = shared_memory.SharedMemory(create=True, size=max(size, 1))
+        else:
+            self._shm = _attach(name)
+        self.array = np.ndarray(self.shape, dtype=self.dtype, buffer=self._shm.buf)
+
+    @classmethod
+    def from_array(cls, values: "np.array") -> "SharedArray":
+        """
+        Copy an array into a new shared array.
+
+        Parameters
+        ----------
+        values:
+            Values to copy
+
+        Returns
+        -------
+        :
+            Shared array
+        """
+        np = _require_numpy()
+        values = np.asarray(values)
+        shared = cls(values.shape, values.dtype)
+        shared.array[...] = values
+        return shared
+
+    @property
+    def name(self) -> str:
+        """Name of the shared memory block"""
+        return self._shm.name
+
+    def close(self) -> None:
+        """
+        Close access to the block from this instance. `array` is no longer
+        usable.
+        """
+        self.array = None
+        self._shm.close()
+
+    def unlink(self) -> None:
+        """
+        Destroy the block, once closed by all processes.
+        """
+        self._shm.unlink()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+        if self.owner:
+            self.unlink()
+
+    def __repr__(self):
+        return f"SharedArray({self.name}, shape={self.shape}, dtype={self.dtype})"
+
+
+# --------------------------------------------------------------------------- #
+# Process Pool                                                                #
+# --------------------------------------------------------------------------- #
+
+
+def _convert_chunk(
+    name: str, dtype: str, start: int, stop: int, converter: Converter
+) -> None:
+    # Run by pool workers, which only attach to the block: the units library
+    # is not built and values are not pickled.
+    np = _require_numpy()
+    shm = _attach(name)
+    try:
+        itemsize = np.dtype(dtype).itemsize
+        values = np.ndarray(
+            (stop - start,), dtype=dtype, buffer=shm.buf, offset=start * itemsize
+        )
+        converter(values, inplace=True)
+        del values
+    finally:
+        shm.close()
+
+
+def convert_parallel(
+    converter: Converter,
+    values: Union[SharedArray, "np.array"],
+    processes: int = None,
+    chunk_size: int = None,
+    executor: ProcessPoolExecutor = None,
+) -> "np.array":
+    """
+    Convert a floating point array in chunks, in place in shared memory, on
+    a pool of processes. Arrays not already shared are copied into a
+    temporary shared block.
+    """
+    np = _require_numpy()
+
+    shared = values
+    if not isinstance(values, SharedArray):
+        shared = SharedArray.from_array(values)
+    try:
+        dtype = shared.array.dtype
+        size = shared.array.size
+        if dtype.kind != "f":
+            raise TypeError("Parallel conversions require a floating point array.")
+
+        if processes is None:
+            processes = os.cpu_count() or 1
+        if chunk_size is None:
+            chunk_size = max(-(-size // (4 * processes)), 65536)
+        if chunk_size < 1:
+            raise ValueError("`chunk_size` must be strictly positive.")
+
+        pool = executor
+        if pool is None:
+            pool = ProcessPoolExecutor(processes)
+        try:
+            futures = [
+                pool.submit(
+                    _convert_chunk,
+                    shared.name,
+                    dtype.str,
+                    start,
+                    min(start + chunk_size, size),
+                    converter,
+                )
+                for start in range(0, size, chunk_size)
+            ]
+            for f in futures:
+                f.result()
+        finally:
+            if executor is None:
+                pool.shutdown()
+
+        if shared is values:
+            return shared.array
+        return np.array(shared.array)
+    finally:
+        if shared is not values:
+            shared.close()
+            shared.unlink()
@@ -1,13 +1,32 @@
-import math
+import functools
+import time
+from typing import Dict
+from typing import Iterable
+from typing import Iterator
+from typing import List
+from typing import Optional
+from typing import Tuple
 from typing import Union
 from typing import TYPE_CHECKING
 
+from planck import _registry
+from planck import _stats
+from planck._frozen import FreezableLibrary
 from planck._scipy import sp_constants
-from planck._scipy import asanyarray
-from planck._scipy import ArrayLike
+from planck._scipy import TEMPERATURE_SCALES
+from planck.models.unit import FactorGroup
 from planck.models.unit import Unit
+from planck.models.unit import UnitView
 from planck._common import shortcuts
+from planck._common import dimensions
+from planck._common import si_base_units
+from planck._common import si_prefixes
+from planck._common import split_prefix
+from planck._common import unit_name
+from planck.backends import import_numpy
 
+# Compound expressions memoized by each library
+EXPRESSIONS_CACHE_SIZE = 1024
 
 TEMPERATURE_UNITS = [
     "degc",
@@ -22,20 +41,438 @@ TEMPERATURE_UNITS = [
 ]
 
 if TYPE_CHECKING:
+    from concurrent.futures import ProcessPoolExecutor
+    from multiprocessing.shared_memory import SharedMemory
+
     import numpy as np
 
+    from planck._search import SearchIndex
+    from planck.models.converter import Converter
+    from planck.shared import SharedArray
+
+_BASE_DIMENSIONS = {
+    k: tuple(int(q == v) for q in dimensions) for k, v in si_base_units.items()
+}
+
+
+def _is_base_expression(expression: str) -> bool:
+    from planck._parser import parse
+
+    try:
+        return all(k in si_base_units for k, _ in parse(expression))
+    except ValueError:
+        return False
+
+
+def _prefix_order(symbol: str) -> int:
+    # Prefixes apply to the first unit of the symbol, such as in km2 or kg/s
+    from planck._parser import parse
+
+    return parse(symbol)[0][1]
+
+
+def _temperature_scale(unit: str) -> str:
+    unit = unit.lower()
+    if unit in ["degc", "celcius"]:
+        return "c"
+    return TEMPERATURE_SCALES.get(unit, unit)
+
+
+def _absolute_temperature(unit: str) -> Optional[Tuple[str, float]]:
+    # Temperature scale of an absolute temperature, and the factor of a
+    # prefixed kelvin such as `mK`
+    if unit.lower() in TEMPERATURE_UNITS:
+        return _temperature_scale(unit), 1.0
+    split = split_prefix(unit)
+    if split is not None and split[0] != "" and split[1] == "K":
+        return "k", si_prefixes[split[0]][0] ** _prefix_order(split[1])
+    return None
+
+
+def _link(definitions: dict, groups: Dict[str, FactorGroup]) -> dict:
+    # Map each known symbol to the defined units it can be expressed from
+    index = {k: [] for k in definitions}
+    for k0, group in groups.items():
+        for k1 in group:
+            index.setdefault(k1, []).append(k0)
+    return index
+
+
 # --------------------------------------------------------------------------- #
 # Main Class                                                                  #
 # --------------------------------------------------------------------------- #
 
 
-class Units(dict):
+class Units(FreezableLibrary):
     """
-    Units library storing `planck.models.Unit` models.
+    Units library built from `planck.models.Unit` definitions.
+
+    Only the defined (base) units are stored when the library is built, each
+    with its conversion factors packed in a single array. Any unit is
+    resolved on first access as a `planck.models.UnitView`, computing its
+    conversion factors from these arrays, and memoized. Units supporting
+    SI prefixes accept any prefix, such as `"GW"` or `"nN"`.
+
+    Lookups are thread-safe. Once built, the library may be frozen with
+    `freeze` to share it between threads as a read-only registry.
     """
 
+    def __init__(self, *args, **kwargs):
+        super().__init__()
+        self._definitions = {}
+        self._index = None
+        self._search = None
+        self._converters = {}
+        self._memoize()
+        for k, v in dict(*args, **kwargs).items():
+            self[k] = v
+
+    def _memoize(self) -> None:
+        # Plans and converters of compound expressions are kept in bounded
+        # caches, as expressions are free-form
+        self._plan = functools.lru_cache(maxsize=EXPRESSIONS_CACHE_SIZE)(
+            self._resolve_plan
+        )
+        self._expression_converter = functools.lru_cache(
+            maxsize=EXPRESSIONS_CACHE_SIZE
+        )(self._build_converter)
+
+    def _clear_expressions(self) -> None:
+        self._plan.cache_clear()
+        self._expression_converter.cache_clear()
+
+    def __getstate__(self) -> dict:
+        state = super().__getstate__()
+        del state["_plan"]
+        del state["_expression_converter"]
+        return state
+
+    def __setstate__(self, state: dict) -> None:
+        super().__setstate__(state)
+        self._memoize()
+
+    # ----------------------------------------------------------------------- #
+    # Lazy Resolution                                                         #
+    # ----------------------------------------------------------------------- #
+
+    def _get_index(self) -> dict:
+        """
+        Map each known unit symbol to the list of defined units it can be
+        expressed from, in definition order. Each defined unit owns a group
+        storing its conversion factors as a contiguous array.
+        """
+        index = self._index
+        if index is None:
+            with self._lock:
+                if self._index is None:
+                    t0 = time.perf_counter()
+                    groups = {
+                        k0: FactorGroup(u, aliases=shortcuts)
+                        for k0, u in self._definitions.items()
+                    }
+                    self._groups = groups
+                    self._index = _link(self._definitions, groups)
+                    _stats.record_build("units_index", time.perf_counter() - t0)
+                index = self._index
+        return index
+
+    def _quantity(self, key: str) -> str:
+        if key in self._definitions:
+            return self._definitions[key].quantity
+        return self._definitions[self._get_index()[key][0]].quantity
+
+    def _resolve_prefixed(self, key):
+        # SI prefixed unit, such as "GW", resolved from its unprefixed unit
+        split = split_prefix(key)
+        if split is None or split[0] == "" or split[1] not in self:
+            raise KeyError(key)
+        p, k = split
+        base = self[k]
+
+        factor = si_prefixes[p][0] ** _prefix_order(k)
+        unit = UnitView(key, base.quantity, refs=base._refs, factor=factor)
+        if base.dimension is not None:
+            unit.scale = base.scale * factor
+            unit.dimension = base.dimension
+
+        return self._publish(key, unit)
+
+    def __missing__(self, key):
+        # Units are resolved under the lock, and fully built before being
+        # published to lock-free readers
+        with self._lock:
+            unit = dict.get(self, key)
+            if unit is None:
+                unit = self._resolve(key)
+        return unit
+
+    def _resolve(self, key):
+        refs = self._get_index().get(key)
+        if refs is None:
+            return self._resolve_prefixed(key)
+
+        groups = [(self._groups[k0], self._groups[k0][key]) for k0 in refs]
+        unit = UnitView(key, self._quantity(key), refs=groups)
+        if key in self._definitions:
+            u = self._definitions[key]
+            unit.name = u.name
+            unit.si_prefixes = u.si_prefixes
+            unit.order = u.order
+
+        try:
+            unit.scale, unit.dimension = self._plan(key)
+        except (KeyError, ValueError):
+            pass
+
+        return self._publish(key, unit)
+
+    # ----------------------------------------------------------------------- #
+    # Compound Expressions                                                    #
+    # ----------------------------------------------------------------------- #
+
+    def _resolve_plan(self, expression: str) -> Tuple[float, Tuple[int, ...]]:
+        """
+        Express `expression` in SI base units. Returns the scale and the
+        dimension exponents vector.
+        """
+        if expression in _BASE_DIMENSIONS:
+            return 1.0, _BASE_DIMENSIONS[expression]
+
+        refs = self._get_index().get(expression)
+        if refs is not None and not _is_base_expression(expression):
+            u = self._definitions.get(expression)
+            if u is not None and u.dimension is not None:
+                return (1.0 if u.scale is None else u.scale), tuple(u.dimension)
+
+            # Known units are expressed from a sibling made of base units only
+            for k0 in refs:
+                group = self._groups[k0]
+                f0 = group[expression]
+                for k, f in group.items():
+                    if k == expression:
+                        continue
+                    u = self._definitions.get(k)
+                    if (u is not None and u.dimension is not None) or (
+                        _is_base_expression(k)
+                    ):
+                        scale, dimension = self._plan(k)
+                        return f / f0 * scale, dimension
+
+        elif refs is None and split_prefix(expression) is not None:
+            p, k = split_prefix(expression)
+            if p != "":
+                scale, dimension = self._plan(k)
+                return scale * si_prefixes[p][0] ** _prefix_order(k), dimension
+
+        elif refs is None and expression.lower() in TEMPERATURE_UNITS:
+            # Temperature intervals, such as in `degc/m`
+            scale, _ = sp_constants.temperature_affine(
+                _temperature_scale(expression), "k"
+            )
+            return scale, _BASE_DIMENSIONS["K"]
+
+        from planck._parser import parse
+
+        scale = 1.0
+        dimension = [0] * len(dimensions)
+        for k, e in parse(expression):
+            if k == expression:
+                raise KeyError(expression)
+            s, d = self._plan(k)
+            scale *= s**e
+            for i, v in enumerate(d):
+                dimension[i] += v * e
+
+        return scale, tuple(dimension)
+
+    def _factor(self, input_unit: str, output_unit: str) -> float:
+        s0, d0 = self._plan(input_unit)
+        s1, d1 = self._plan(output_unit)
+        if d0 != d1:
+            raise KeyError(
+                f"Units '{input_unit}' and '{output_unit}' are not commensurable."
+            )
+        return s0 / s1
+
+    def dimension(self, unit: str) -> Tuple[int, ...]:
+        """
+        Dimension exponents vector of a unit or compound unit expression. See
+        `planck.models.Unit` for the order of the dimensions.
+
+        Parameters
+        ----------
+        unit:
+            Unit symbol or expression
+
+        Returns
+        -------
+        :
+            Dimension exponents
+
+        Examples
+        --------
+        ```py
+        from planck import units
+
+        print(units.dimension("lb*ft/s2"))
+        #> (1, 1, -2, 0, 0, 0, 0, 0)
+        ```
+        """
+        return self._plan(unit)[1]
+
+    def compatible(self, unit0: str, unit1: str) -> bool:
+        """
+        Return `True` if both units can be converted into one another with
+        `converter`: either through the factors defined in the library, such
+        as between cycles (`Hz`, `rpm`) and angular velocities (`rad/s`), or
+        because both units share the same dimension.
+
+        Parameters
+        ----------
+        unit0:
+            Unit symbol or expression
+        unit1:
+            Unit symbol or expression
+
+        Returns
+        -------
+        :
+            Compatibility flag
+        """
+        try:
+            self.converter(unit0, unit1)
+        except (KeyError, ValueError, NotImplementedError):
+            return False
+        return True
+
+    def __setitem__(self, key, unit):
+        self._check_frozen()
+        self._definitions[key] = unit
+        self._index = None
+        self._search = None
+        self._converters = {}
+        self._clear_expressions()
+        super().clear()
+
+    # ----------------------------------------------------------------------- #
+    # Registration                                                            #
+    # ----------------------------------------------------------------------- #
+
+    def register(self, unit: Unit) -> None:
+        """
+        Add a unit to the library. The unit is linked to the units it is
+        defined with, such as a reference unit of its quantity, and only the
+        entries and cached conversions of these units are updated.
+
+        Parameters
+        ----------
+        unit:
+            Unit definition
+
+        Examples
+        --------
+        ```py
+        from planck import models
+        from planck.units import Units
+
+        library = Units()
+        library.register(models.Unit(symbol="m", quantity="length", values={}))
+        library.register(
+            models.Unit(symbol="furlong", quantity="length", values={"m": 201.168})
+        )
+        print(library.convert(2.0, "furlong", "m"))
+        #> 402.336
+        ```
+        """
+        self.register_many([unit])
+
+    def register_many(self, units: Iterable[Unit]) -> None:
+        """
+        Add multiple units to the library, as `register`. The search index is
+        rebuilt once, on the next search.
+
+        Parameters
+        ----------
+        units:
+            Unit definitions
+        """
+        self._check_frozen()
+        with self._lock:
+            affected = set()
+            for unit in units:
+                key = unit.symbol
+                if key in self._definitions:
+                    # Redefinitions may change any conversion
+                    self[key] = unit
+                    affected = set()
+                    continue
+
+                self._definitions[key] = unit
+                if self._index is None:
+                    continue
+
+                group = FactorGroup(unit, aliases=shortcuts)
+                self._groups[key] = group
+                for k in group:
+                    self._index[k] = self._index.get(k, []) + [key]
+                affected.update(group)
+
+            self._search = None
+            if not affected:
+                return
+
+            # Memoized units, including SI prefixed ones, of affected units
+            for k in list(dict.keys(self)):
+                split = split_prefix(k)
+                if k in affected or (split is not None and split[1] in affected):
+                    dict.pop(self, k, None)
+
+            # Conversions of affected units and of compound expressions
+            index = self._index
+            self._converters = {
+                (k0, k1): c
+                for (k0, k1), c in self._converters.items()
+                if k0 in index and k1 in index and not {k0, k1} & affected
+            }
+            self._clear_expressions()
+
+    def __contains__(self, key):
+        if key in self._get_index():
+            return True
+        split = split_prefix(key)
+        return split is not None and split[0] != "" and split[1] in self._index
+
+    def __iter__(self):
+        return iter(self._get_index())
+
+    def __len__(self):
+        return len(self._get_index())
+
+    def get(self, key, default=None):
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def keys(self):
+        return self._get_index().keys()
+
+    def values(self):
+        return [self[k] for k in self]
+
+    def items(self):
+        return [(k, self[k]) for k in self]
+
     def convert(
-        self, value: Union[float, "np.array"], input_unit: str, output_unit: str
+        self,
+        value: Union[float, "np.array"],
+        input_unit: str,
+        output_unit: str,
+        out: "np.array" = None,
+        inplace: bool = False,
+        dtype: "np.dtype" = None,
+        workers: int = None,
+        chunk_size: int = None,
     ) -> Union[float, "np.array"]:
         """
         Convert a `value` from `input_unit` to `output_unit`
@@ -48,6 +485,21 @@ class Units(dict):
             Source unit
         output_unit:
             Target unit
+        out:
+            NumPy array in which the result is written, avoiding the
+            allocation of a new array.
+        inplace:
+            If `True`, `value` (a NumPy array) is overwritten with the result.
+        dtype:
+            NumPy data type of the result, such as `float32`. By default, NumPy
+            type promotion rules apply.
+        workers:
+            Number of threads converting a large NumPy array. The array is
+            split into blocks of `chunk_size` values, converted concurrently
+            into a single output array.
+        chunk_size:
+            Number of values converted at once by each thread. Defaults to
+            65536, which fits in the CPU cache.
 
         Returns
         -------
@@ -66,23 +518,523 @@ class Units(dict):
         #> 273.15
         ```
         """
+        try:
+            converter = self._converters[(input_unit, output_unit)]
+        except KeyError:
+            converter = self.converter(input_unit, output_unit)
+        if workers is None:
+            return converter(value, out=out, inplace=inplace, dtype=dtype)
+        return converter(
+            value,
+            out=out,
+            inplace=inplace,
+            dtype=dtype,
+            workers=workers,
+            chunk_size=chunk_size,
+        )
+
+    def converter(self, input_unit: str, output_unit: str) -> "Converter":
+        """
+        Build a reusable converter from `input_unit` to `output_unit`. The
+        conversion factor (or affine transform for temperatures) is resolved
+        once and cached.
+
+        Units missing from the library may be given as compound expressions,
+        such as `"lb*ft/s2"` or `"kg/m/s^2"`, of known units. They are
+        converted if both units reduce to the same SI base units.
+
+        Parameters
+        ----------
+        input_unit:
+            Source unit
+        output_unit:
+            Target unit
+
+        Returns
+        -------
+        :
+            Converter
+
+        Examples
+        --------
+        ```py
+        from planck import units
+
+        c_to_f = units.converter("degc", "F")
+        print(c_to_f(100.0))
+        #> 212.0
+        print(c_to_f.inverse(212.0))
+        #> 100.0
+
+        print(units.converter("lb*ft/s2", "N")(1.0))
+        #> 0.13825495437599997
+        ```
+        """
+        key = (input_unit, output_unit)
+        converter = self._converters.get(key)
+        if converter is not None:
+            return converter
+
+        # Only conversions between library units are memoized without bound
+        if input_unit in self and output_unit in self:
+            converter = self._build_converter(input_unit, output_unit)
+            return self._converters.setdefault(key, converter)
+        return self._expression_converter(input_unit, output_unit)
+
+    def _build_converter(self, input_unit: str, output_unit: str) -> "Converter":
+        from planck.models.converter import Converter
+
+        # Temperature, if any unit is an absolute temperature
+        t0 = _absolute_temperature(input_unit)
+        t1 = _absolute_temperature(output_unit)
+        if t0 is not None or t1 is not None:
+            s0, f0 = t0 or (input_unit, 1.0)
+            s1, f1 = t1 or (output_unit, 1.0)
+            scale, offset = sp_constants.temperature_affine(s0, s1)
+            converter = Converter(input_unit, output_unit, scale * f0 / f1, offset / f1)
+        else:
+            try:
+                factor = self[input_unit][output_unit]
+            except KeyError:
+                factor = self._factor(input_unit, output_unit)
+            converter = Converter(input_unit, output_unit, factor)
+
+        return converter
+
+    def convert_many(
+        self,
+        values: Union[list, "np.array"],
+        input_units: Union[str, list, "np.array"],
+        output_units: Union[str, list, "np.array"],
+    ) -> Union[list, "np.array"]:
+        """
+        Convert values each expressed in its own unit. Unit labels are
+        interned and a single conversion is resolved for each distinct pair
+        of units. With NumPy, all values are then converted at once by
+        gathering the factors (and temperature offsets) of their pair.
+
+        Parameters
+        ----------
+        values:
+            Values to convert
+        input_units:
+            Source unit of each value, or a single unit for all values
+        output_units:
+            Target unit of each value, or a single unit for all values
+
+        Returns
+        -------
+        :
+            Converted values, as a NumPy array if NumPy is installed and as a
+            list otherwise.
+
+        Examples
+        --------
+        ```py
+        from planck import units
+
+        values = units.convert_many([1.0, 2.0, 0.0], ["m", "m", "degc"], ["mm", "km", "F"])
+        print([float(v) for v in values])
+        #> [1000.0, 0.002, 32.0]
+        ```
+        """
+        n = len(values)
+        if isinstance(input_units, str):
+            input_units = [input_units] * n
+        if isinstance(output_units, str):
+            output_units = [output_units] * n
+        if len(input_units) != n or len(output_units) != n:
+            raise ValueError("Values and units must have the same length.")
+
+        np = import_numpy()
+        if np is None:
+            converters = {}
+            out = []
+            for v, u0, u1 in zip(values, input_units, output_units):
+                c = converters.get((u0, u1))
+                if c is None:
+                    c = converters[(u0, u1)] = self.converter(u0, u1)
+                out += [v * c.scale + c.offset]
+            return out
+
+        # Intern unit labels, then pairs of labels, as integer codes
+        labels0, codes0 = np.unique(np.asarray(input_units), return_inverse=True)
+        labels1, codes1 = np.unique(np.asarray(output_units), return_inverse=True)
+        pairs, codes = np.unique(
+            codes0.ravel() * len(labels1) + codes1.ravel(), return_inverse=True
+        )
+
+        scales = np.empty(len(pairs))
+        offsets = np.empty(len(pairs))
+        for i, p in enumerate(pairs.tolist()):
+            c = self.converter(
+                str(labels0[p // len(labels1)]), str(labels1[p % len(labels1)])
+            )
+            scales[i] = c.scale
+            offsets[i] = c.offset
+
+        out = np.take(scales, codes) * np.asarray(values, dtype=float)
+        if offsets.any():
+            out += np.take(offsets, codes)
+        return out
+
+    def iconvert(
+        self,
+        iterable: Iterable[float],
+        input_unit: str,
+        output_unit: str,
+        chunk_size: int = 65536,
+    ) -> Iterator[float]:
+        """
+        Lazily convert an iterable of values, such as a generator or a file
+        too large to fit in memory. Values are batched into arrays of
+        `chunk_size` items, each converted at once, so memory use is bounded
+        by the chunk size.
+
+        Parameters
+        ----------
+        iterable:
+            Values to convert
+        input_unit:
+            Source unit
+        output_unit:
+            Target unit
+        chunk_size:
+            Number of values converted at once
+
+        Returns
+        -------
+        :
+            Generator of converted values
+
+        Examples
+        --------
+        ```py
+        from planck import units
+
+        values = (float(i) for i in range(3))
+        print(list(units.iconvert(values, "km", "m", chunk_size=2)))
+        #> [0.0, 1000.0, 2000.0]
+        ```
+        """
+        from planck import _streams
+
+        converter = self.converter(input_unit, output_unit)
+        return _streams.iconvert(converter, iterable, chunk_size)
+
+    def convert_csv(
+        self,
+        source,
+        destination,
+        columns: Dict[str, Tuple[str, str]],
+        chunk_size: int = 65536,
+        **fmtparams,
+    ) -> int:
+        """
+        Convert columns of a CSV file, streaming `chunk_size` rows at a time
+        with constant memory. Other columns and empty cells are written
+        unchanged.
+
+        Parameters
+        ----------
+        source:
+            Path or text file object of the CSV file to read, with a header
+            row
+        destination:
+            Path or text file object of the CSV file to write
+        columns:
+            Mapping of column names to `(input_unit, output_unit)`
+        chunk_size:
+            Number of rows converted at once
+        fmtparams:
+            Formatting parameters of `csv.reader` and `csv.writer`, such as
+            `delimiter`
+
+        Returns
+        -------
+        :
+            Number of rows written, excluding the header
+        """
+        from planck import _streams
+
+        converters = {c: self.converter(*units) for c, units in columns.items()}
+        return _streams.convert_csv(
+            source, destination, converters, chunk_size, **fmtparams
+        )
+
+    def convert_file(
+        self,
+        source: str,
+        destination: str,
+        input_unit: str,
+        output_unit: str,
+        dtype: "np.dtype" = None,
+        fields: List[str] = None,
+        chunk_size: int = 1_048_576,
+    ) -> int:
+        """
+        Convert a binary file too large to fit in memory, such as a raw
+        float32 recording or a `.npy` file. Both files are memory mapped
+        `chunk_size` records at a time, in page-aligned chunks read and
+        written sequentially, so resident memory is bounded by the chunk
+        size. Requires NumPy.
+
+        Parameters
+        ----------
+        source:
+            Path of the file to read. `.npy` files are detected from their
+            header.
+        destination:
+            Path of the file to write, in the format of `source`. If it is
+            `source` itself, the file is converted in place.
+        input_unit:
+            Source unit
+        output_unit:
+            Target unit
+        dtype:
+            NumPy data type of the records of raw files. Defaults to
+            `float64`. Read from the header of `.npy` files.
+        fields:
+            Fields converted for structured data types. Other fields are
+            copied unchanged.
+        chunk_size:
+            Number of records mapped at once, rounded to whole pages
+
+        Returns
+        -------
+        :
+            Number of records converted
+        """
+        from planck import _files
+
+        converter = self.converter(input_unit, output_unit)
+        return _files.convert_file(
+            converter, source, destination, dtype, fields, chunk_size
+        )
+
+    def convert_file_inplace(
+        self,
+        path: str,
+        input_unit: str,
+        output_unit: str,
+        dtype: "np.dtype" = None,
+        fields: List[str] = None,
+        chunk_size: int = 1_048_576,
+    ) -> int:
+        """
+        Convert a raw binary or `.npy` file in place, as `convert_file`,
+        without any additional disk space.
+
+        Parameters
+        ----------
+        path:
+            Path of the file
+        input_unit:
+            Source unit
+        output_unit:
+            Target unit
+        dtype:
+            NumPy data type of the records of raw files. Defaults to
+            `float64`. Read from the header of `.npy` files.
+        fields:
+            Fields converted for structured data types
+        chunk_size:
+            Number of records mapped at once, rounded to whole pages
+
+        Returns
+        -------
+        :
+            Number of records converted
+        """
+        from planck import _files
+
+        converter = self.converter(input_unit, output_unit)
+        return _files.convert_file_inplace(converter, path, dtype, fields, chunk_size)
+
+    def convert_frame(self, frame, columns: Dict[str, Tuple[str, str]]):
+        """
+        Convert multiple columns of a pandas DataFrame or of a pyarrow Table
+        in a single call. Arrow columns are converted with `pyarrow.compute`
+        kernels, preserving nulls, chunks and floating point types.
+
+        Parameters
+        ----------
+        frame:
+            pandas DataFrame or pyarrow Table
+        columns:
+            Mapping of column names to `(input_unit, output_unit)`
+
+        Returns
+        -------
+        :
+            New DataFrame or Table with converted columns
+        """
+        from planck import _frames
+
+        converters = {c: self.converter(*units) for c, units in columns.items()}
+
+        module = type(frame).__module__.split(".")[0]
+        if module == "pandas":
+            return _frames.convert_pandas(frame, converters)
+        if module == "pyarrow":
+            return _frames.convert_arrow(frame, converters)
+        raise TypeError(f"Frames of type {type(frame)} are not supported.")
+
+    def convert_parallel(
+        self,
+        values: Union["SharedArray", "np.array"],
+        input_unit: str,
+        output_unit: str,
+        processes: int = None,
+        chunk_size: int = None,
+        executor: "ProcessPoolExecutor" = None,
+    ) -> "np.array":
+        """
+        Convert a large floating point array on a pool of processes. The
+        array is split into chunks, converted in place in shared memory by
+        the workers: values are never pickled and workers do not build the
+        units library.
+
+        Parameters
+        ----------
+        values:
+            Values to convert. A `planck.shared.SharedArray` is converted in
+            place. Other arrays are copied into a temporary shared block.
+        input_unit:
+            Source unit
+        output_unit:
+            Target unit
+        processes:
+            Number of worker processes. Defaults to the number of CPUs.
+        chunk_size:
+            Number of values converted by each task
+        executor:
+            Existing process pool, reused across calls to avoid starting
+            workers each time
+
+        Returns
+        -------
+        :
+            Converted values, the array of `values` if shared and a new array
+            otherwise
+        """
+        from planck import shared
+
+        converter = self.converter(input_unit, output_unit)
+        return shared.convert_parallel(
+            converter, values, processes, chunk_size, executor
+        )
+
+    def share(self) -> "SharedMemory":
+        """
+        Export the units library into a new `multiprocessing.shared_memory`
+        block, which worker processes attach to with `Units.attach`. The
+        caller owns the block and must `close` and `unlink` it once workers
+        are done.
+
+        Returns
+        -------
+        :
+            Shared memory block
+        """
+        from planck import shared
+
+        self._get_index()
+        with self._lock:
+            return shared.export_registry(self._definitions, self._groups)
+
+    @classmethod
+    def attach(cls, name: str) -> "Units":
+        """
+        Build a read-only units library from a block exported with
+        `Units.share`, typically in a worker process initializer. Conversion
+        factors are read from the shared block without being copied and the
+        library is frozen: it stays attached while it is alive.
+
+        Parameters
+        ----------
+        name:
+            Name of the shared memory block
+
+        Returns
+        -------
+        :
+            Frozen units library
+
+        Examples
+        --------
+        ```py
+        from planck import units
+        from planck.units import Units
+
+        block = units.share()
+        worker_units = Units.attach(block.name)
+        print(worker_units.convert(1.0, "m", "ft"))
+        #> 3.280839895013124
+
+        block.close()
+        block.unlink()
+        ```
+        """
+        from planck import shared
+
+        shm, definitions, groups = shared.attach_registry(name)
+        library = cls()
+        library._definitions = definitions
+        library._groups = groups
+        library._index = _link(definitions, groups)
+        shared.keep_attached(library, shm, groups)
 
-        # Temperature
-        if input_unit.lower() in TEMPERATURE_UNITS:
-            if input_unit == "degc":
-                input_unit = "c"
-            if output_unit == "degc":
-                output_unit = "c"
-            return sp_constants.convert_temperature(value, input_unit, output_unit)
+        # Units are still resolved on demand, under the lock
+        library._frozen = True
+        return library
 
-        output = asanyarray(value) * self[input_unit][output_unit]
-        if isinstance(output, ArrayLike):
-            output = output.to_list()
-        return output
+    def update(self, *args, **kwargs):
+        for k, v in dict(*args, **kwargs).items():
+            self[k] = v
 
-    def find(self, sub: str = None, quantity: str = None) -> list:
+    def _prepare(self):
+        # Resolve defined units and build indexes, so that common lookups of
+        # a frozen library never take the lock
+        for k in self._get_index():
+            self[k]
+        self._get_search()
+
+    def load(self, path: str) -> None:
         """
-        Return unit keys containing a given string
+        Add the units of a JSON definition file, such as site-specific units.
+        Files listed in the `PLANCK_DEFINITIONS` environment variable are
+        loaded when the library is built.
+
+        Parameters
+        ----------
+        path:
+            Path of the definition file. Each unit is defined by its `symbol`,
+            `quantity` and `values` in other units, and optionally its
+            `name`, `si_prefixes` and `order`.
+        """
+        self.register_many(_registry.load(path)[0].values())
+
+    def _get_search(self) -> "SearchIndex":
+        search = self._search
+        if search is None:
+            from planck._search import SearchIndex
+
+            keys = list(self._get_index())
+            names = {}
+            for k in keys:
+                u = self._definitions.get(k)
+                names[k] = unit_name(k) if u is None else u.name
+            search = SearchIndex(
+                keys, quantities={k: self._quantity(k) for k in keys}, names=names
+            )
+            self._search = search
+        return search
+
+    def find(self, sub: str = None, quantity: str = None, fuzzy: bool = False) -> list:
+        """
+        Return unit keys containing a given string. Queries are resolved from
+        a search index built once and memoized.
 
         Parameters
         ----------
@@ -90,272 +1042,64 @@ class Units(dict):
            Sub-string to search keys for. By default, return all keys.
         quantity:
            Specific quantity ["length", "mass", "volume", "pressure", etc.]
+        fuzzy:
+           If `True`, return keys whose symbol or name is similar to `sub`,
+           such as `"m"` for `"meter"`, best matches first.
 
         Returns
         ------
         keys:
            List of keys
-        """
-        if sub is None:
-            sub = ""
-
-        # Get Keys
-        keys = []
-        for k, v in self.items():
-            if sub in k:
-                if not quantity or v.quantity == quantity.lower():
-                    keys += [k]
-        keys.sort()
-
-        # Return keys
-        return keys
-
-
-# --------------------------------------------------------------------------- #
-# Build Constants                                                             #
-# --------------------------------------------------------------------------- #
 
-d = Units({})
+        Examples
+        --------
+        ```py
+        from planck import units
 
-# --------------------------------------------------------------------------- #
-# Base Units                                                                  #
-# ref : https://en.wikipedia.org/wiki/SI_base_unit                            #
-# --------------------------------------------------------------------------- #
+        print(units.find("ft", quantity="area"))
+        #> ['ft2']
+        print(units.find("newtn", fuzzy=True))
+        #> ['N']
+        ```
+        """
+        search = self._get_search()
+        if fuzzy:
+            return list(search.fuzzy(sub or "", quantity=quantity))
+        return list(search.find(sub, quantity=quantity))
 
-# Length
-s = "m"
-d[s] = Unit(
-    symbol=s,
-    quantity="length",
-    values={
-        "in": 1.0 / sp_constants.inch,
-        "ft": 1.0 / sp_constants.foot,
-        "mi": 1.0 / sp_constants.mile,
-        "NM": 1.0 / sp_constants.nautical_mile,
-    },
-    si_prefixes=["m", "c", "", "k"],
-)
-
-# Mass
-s = "kg"
-d[s] = Unit(
-    symbol=s,
-    quantity="mass",
-    values={
-        "lb": 1.0 / sp_constants.pound,
-        "slug": 1.0 / sp_constants.pound / (sp_constants.g * d["m"]["ft"]),
-    },
-    si_prefixes=["m", "", "k"],
-)
-
-# Time
-s = "s"
-d[s] = Unit(
-    symbol=s,
-    quantity="time",
-    values={
-        "min": 1 / sp_constants.minute,
-        "h": 1 / sp_constants.hour,
-        "d": 1 / sp_constants.day,
-        "week": 1 / int(7 * 24 * 3600),
-        "month": 1 / int(365 / 12 * 24 * 3600),
-        "a": 1 / sp_constants.year,
-    },
-    si_prefixes=["", "m", "mu", "n"],
-)
+    def symbol(self, name: str) -> str:
+        """
+        Return the key of a unit from its name, ignoring case.
 
+        Parameters
+        ----------
+        name:
+            Unit name, such as `"metre"`
 
-# --------------------------------------------------------------------------- #
-# Derived Units                                                               #
-# ref : https://en.wikipedia.org/wiki/SI_derived_unit                         #
-# --------------------------------------------------------------------------- #
+        Returns
+        -------
+        :
+            Unit key
+        """
+        key = self._get_search().key_from_name(name)
+        if key is None:
+            raise KeyError(f"No unit named '{name}'.")
+        return key
 
-# Area
-s = "m2"
-d[s] = Unit(
-    symbol=s,
-    quantity="area",
-    values={
-        "in2": d[s[:-1]]["in"] ** 2,
-        "ft2": d[s[:-1]]["ft"] ** 2,
-        "mi2": d[s[:-1]]["mi"] ** 2,
-    },
-    si_prefixes=["m", "c", "", "k"],
-    order=2,
-)
-
-# Volume
-s = "m3"
-d[s] = Unit(
-    symbol=s,
-    quantity="area",
-    values={
-        "in3": d[s[:-1]]["in"] ** 3,
-        "ft3": d[s[:-1]]["ft"] ** 3,
-        "mi3": d[s[:-1]]["mi"] ** 3,
-    },
-    si_prefixes=["m", "c", "", "k"],
-    order=3,
-)
-
-# Velocity
-s = "m/s"
-d[s] = Unit(
-    symbol=s,
-    quantity="velocity",
-    values={
-        "ft/s": d["m"]["ft"],
-        "km/h": d["m"]["km"] / d["s"]["h"],
-        "ft/min": d["m"]["ft"] / d["s"]["min"],
-        "kt": d["m"]["NM"] / d["s"]["h"],
-    },
-)
-
-# Angle
-s = "rad"
-d[s] = Unit(
-    symbol=s,
-    quantity="angle",
-    values={
-        "deg": 1.0 / sp_constants.degree,
-    },
-)
-
-# Angular velocity
-s = "rad/s"
-d[s] = Unit(
-    symbol=s,
-    quantity="angular velocity",
-    values={
-        "deg/s": 1 * d["rad"]["deg"],
-    },
-)
-
-# Mass flow rate
-s = "kg/s"
-d[s] = Unit(
-    symbol=s,
-    quantity="mass flow rate",
-    values={
-        "kg/h": 1 / d["s"]["h"],
-        "lb/s": d["kg"]["lb"],
-        "lb/h": d["kg"]["lb"] / d["s"]["h"],
-    },
-)
-
-# Frequency
-s = "Hz"
-d[s] = Unit(
-    symbol=s,
-    quantity="frequency",
-    values={
-        "1/s": 1.0,
-        "1/min": 1 / d["s"]["min"],
-        "rad/s": 2 * math.pi,
-    },
-    si_prefixes=["", "k", "M"],
-)
-
-# Force
-s = "N"
-d[s] = Unit(
-    symbol=s,
-    quantity="force",
-    values={
-        "kg*m/s2": 1.0,
-        "lb": d["kg"]["lb"] / sp_constants.g,
-    },
-    si_prefixes=["", "k"],
-)
-
-# Pressure
-s = "Pa"
-d[s] = Unit(
-    symbol=s,
-    quantity="pressure",
-    values={
-        "N/m2": 1.0,
-        "kg/m/s2": 1.0,
-        "lb/in2": d["kg"]["lb"] / d["m2"]["in2"] / sp_constants.g,
-        "lb/ft2": d["kg"]["lb"] / d["m2"]["ft2"] / sp_constants.g,
-        "bar": 1.0 / sp_constants.bar,
-        "mbar": 1.0 / sp_constants.bar * 1000.0,
-        "kPa": 1.0 / 1e3,
-        "MPa": 1.0 / 1e6,
-    },
-)
-
-# Torque
-s = "N*m"
-d[s] = Unit(
-    symbol=s,
-    quantity="torque",
-    values={
-        "J": 1.0,
-        "m2*kg/s2": 1.0,
-        "lb*in": d["kg"]["slug"] * d["m"]["ft"] * d["m"]["in"],
-        "lb*ft": d["kg"]["slug"] * d["m"]["ft"] * d["m"]["ft"],
-    },
-)
-
-
-# Power
-s = "W"
-d[s] = Unit(
-    symbol=s,
-    quantity="power",
-    values={
-        "kg*m2/s3": 1.0,
-        "J/s": 1.0,
-        "hp": 1.0 / sp_constants.hp,
-        "ft*lb/s": 1.0 / sp_constants.hp * 550,
-        "ft*lb/min": 1.0 / sp_constants.hp * 550 * sp_constants.minute,
-    },
-    si_prefixes=["", "k", "M"],
-)
-
-# Density
-s = "g/m3"
-d[s] = Unit(
-    symbol=s,
-    quantity="density",
-    values={
-        "slug/ft3": d["kg"]["slug"] / d["m3"]["ft3"],
-        "kg/m3": 1.0 / 1000.0,
-    },
-)
 
 # --------------------------------------------------------------------------- #
-# Create shortcuts                                                            #
+# Build Units                                                                 #
 # --------------------------------------------------------------------------- #
 
-for k0 in list(d.keys()):
-    for k1 in list(d[k0].keys()):
-        if k1 in shortcuts:
-            d[k0][shortcuts[k1]] = d[k0][k1]
 
+def _build() -> Units:
+    t0 = time.perf_counter()
+    library = Units({})
+    for path in _registry.definition_files():
+        library.load(path)
+    _stats.record_build("units", time.perf_counter() - t0)
+    return library
 
-# --------------------------------------------------------------------------- #
-# Create all permutations                                                     #
-# --------------------------------------------------------------------------- #
 
-# Permutations of output units
-for k0 in list(d.keys()):
-    k1s = list(d[k0].keys())
-    for k1 in k1s:
-        for k2 in k1s:
-            if k1 not in d.keys():
-                d[k1] = Unit(symbol=k1, quantity=d[k0].quantity)
-            if k2 not in d[k1].keys():
-                d[k1][k2] = d[k0][k2] / d[k0][k1]
-
-# Inverse relationships
-for k0 in list(d.keys()):
-    for k1 in list(d[k0].keys()):
-        if k1 not in d.keys():
-            d[k1] = Unit(symbol=k1, quantity=d[k0].quantity)
-        if k0 not in d[k1].keys():
-            d[k1][k0] = 1.0 / d[k0][k1]
-
-units = d
+units = _build()
 """Units Library"""
@@ -0,0 +1,69 @@
+import pytest
+
+from planck import atmosphere
+from planck import constants
+from planck import models
+
+
+def test_isa():
+    atm = atmosphere.isa(0.0)
+    assert atm.temperature == pytest.approx(288.15)
+    assert atm.pressure == pytest.approx(101325.0)
+    assert atm.density == pytest.approx(1.225, rel=1e-4)
+    assert atm.speed_of_sound == pytest.approx(340.29, rel=1e-4)
+
+    atm = atmosphere.isa(11.0, "km")
+    assert atm.temperature == pytest.approx(216.65)
+    assert atm.pressure == pytest.approx(22632, rel=1e-4)
+
+    atm = atmosphere.isa(15000, "m")
+    assert atm.temperature == pytest.approx(216.65)
+    assert atm.pressure == pytest.approx(12045, rel=1e-4)
+    assert atm.density == pytest.approx(0.19367, rel=1e-4)
+
+    # ISA constants are read again once changed
+    t0 = constants["isa_T0"]
+    try:
+        constants["isa_T0"] = models.DimensionalPhysicalConstant(
+            "isa_T0", t0.name, {"K": 300.0}
+        )
+        assert atmosphere.isa(0.0).temperature == 300.0
+    finally:
+        constants["isa_T0"] = t0
+    assert atmosphere.isa(0.0).temperature == pytest.approx(288.15)
+
+
+def test_isa_numpy():
+    np = pytest.importorskip("numpy")
+
+    h = np.array([0.0, 5000.0, 11000.0, 15000.0])
+    atm = atmosphere.isa(h, "m")
+    for i, v in enumerate(h):
+        expected = atmosphere.isa(float(v), "m")
+        for a, b in zip(atm, expected):
+            assert a[i] == pytest.approx(b)
+
+    # float32 and output buffers
+    h32 = (h / 0.3048).astype("float32")
+    out = tuple(np.empty(4, dtype="float32") for _ in range(4))
+    atm32 = atmosphere.isa(h32, "ft", out=out)
+    assert atm32.pressure is out[1]
+    assert atm32.density.dtype == np.float32
+    assert atm32.pressure == pytest.approx(atm.pressure, rel=1e-5)
+
+    atm = atmosphere.isa([0, 1000], "m", dtype="float32")
+    assert atm.temperature.dtype == np.float32
+
+    # Half floats are promoted to float32
+    atm16 = atmosphere.isa(h.astype("float16"), "m")
+    assert atm16.pressure.dtype == np.float32
+    assert np.isfinite(atm16.density).all()
+    assert atm16.pressure == pytest.approx(atmosphere.isa(h, "m").pressure, rel=1e-5)
+
+    with pytest.raises(ValueError):
+        atmosphere.isa(h, "m", out=out[:2])
+
+
+if __name__ == "__main__":
+    test_isa()
+    test_isa_numpy()
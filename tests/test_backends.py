@@ -0,0 +1,87 @@
+import array
+
+import pytest
+
+from planck import backends
+from planck import units
+
+
+def test_python_backend():
+    b = backends.PythonBackend()
+    assert b.supports(list)
+    assert b.affine([0, 1], 1000.0) == [0, 1000]
+    assert b.affine((0, 1), 1.8, 32.0) == [32, 33.8]
+
+    a = array.array("f", [0.0, 1.0])
+    c = b.affine(a, 1000.0)
+    assert c.typecode == "f"
+    assert c.tolist() == [0, 1000]
+
+    c = b.affine(a, 1000.0, out=a)
+    assert c is a
+    assert a.tolist() == [0, 1000]
+
+    d = array.array("d", [0.0, 0.0])
+    c = b.affine(memoryview(a), 0.001, 1.0, out=memoryview(d))
+    assert d.tolist() == [1, 2]
+
+    c = b.affine([0, 1], 2.0, dtype="float64")
+    assert c == array.array("d", [0, 2])
+    with pytest.raises(TypeError):
+        b.affine([0, 1], 2.0, dtype="int8")
+
+
+def test_native_backend():
+    class Values:
+        def __init__(self, v):
+            self.v = v
+
+        def __mul__(self, other):
+            return Values(self.v * other)
+
+        def __add__(self, other):
+            return Values(self.v + other)
+
+    b = backends.get_backend(Values(1.0))
+    assert b.name == "native"
+    assert units.convert(Values(1.0), "degc", "K").v == 274.15
+
+
+def test_numpy_backend():
+    np = pytest.importorskip("numpy")
+
+    b = backends.get_backend(np.ones(2))
+    assert b.name == "numpy"
+    assert backends.get_backend([1.0]) is b
+
+    a = np.ones(3, dtype="float32")
+    c = b.affine(a, 2.0, 1.0)
+    assert c.dtype == np.float32
+    assert c.tolist() == [3, 3, 3]
+
+
+def test_register_backend():
+    class RangeBackend(backends.Backend):
+        name = "range"
+
+        def supports(self, cls):
+            return issubclass(cls, range)
+
+        def affine(self, value, scale, offset=0.0, out=None, dtype=None):
+            return tuple(v * scale + offset for v in value)
+
+    backends.register_backend(RangeBackend())
+    try:
+        assert backends.get_backend(range(2)).name == "range"
+        assert units.convert(range(2), "km", "m") == (0, 1000)
+    finally:
+        backends._custom_backends.clear()
+        backends._backends = None
+        backends._cache.clear()
+
+
+if __name__ == "__main__":
+    test_python_backend()
+    test_native_backend()
+    test_numpy_backend()
+    test_register_backend()
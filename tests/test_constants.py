@@ -1,3 +1,8 @@
+import copy
+import pickle
+
+import pytest
+
 from planck import constants
 
 
@@ -31,7 +36,73 @@ def test_find():
         "isa_rho0",
     ]
 
+    assert constants.find("gravity", fuzzy=True)[0] == "g_acc"
+
+
+def test_find_update():
+    from planck.constants import Constants
+
+    lib = Constants({"a": constants["g_acc"]})
+    assert lib.find() == ["a"]
+    lib["b"] = constants["R"]
+    assert lib.find() == ["a", "b"]
+    del lib["a"]
+    assert lib.find() == ["b"]
+
+
+def test_freeze():
+    from planck.constants import Constants
+
+    lib = Constants({"a": constants["g_acc"]}).freeze()
+    assert lib.find() == ["a"]
+    with pytest.raises(TypeError):
+        lib["b"] = constants["R"]
+    with pytest.raises(TypeError):
+        del lib["a"]
+
+
+def test_pickle():
+    lib = pickle.loads(pickle.dumps(constants))
+    assert lib.find("g_acc") == ["g_acc"]
+    assert lib["g_acc"]["ft/s2"] == constants["g_acc"]["ft/s2"]
+    assert lib["gamma_air"] == constants["gamma_air"]
+    assert lib["gamma_air"].name == constants["gamma_air"].name
+
+    lib = copy.deepcopy(lib.freeze())
+    assert lib.frozen
+    with pytest.raises(TypeError):
+        lib["b"] = constants["R"]
+
+
+def test_derived_units():
+    r = constants["earth_radius"]
+    assert "mi" not in r
+    assert r["mi"] == pytest.approx(3958.756)
+    assert "mi" not in r
+    assert r._derived["mi"] == r["mi"]
+    assert constants["g_acc"]["km/h2"] == pytest.approx(127094.184)
+    assert constants["zero_degc"]["F"] == pytest.approx(32.0)
+    with pytest.raises(KeyError):
+        constants["g_acc"]["kg"]
+
+
+def test_values():
+    values = constants.values(["g_acc", "isa_p0", "gamma_air"], ["ft/s2", "Pa", None])
+    assert list(values) == pytest.approx([32.174049, 101325.0, 1.4])
+    assert list(constants.values(["isa_T0", "isa_T_tropo"], "degc")) == pytest.approx(
+        [15.0, -56.5]
+    )
+    assert len(constants.values()) == len(constants)
+
+    with pytest.raises(ValueError):
+        constants.values(["g_acc"], ["m/s2", "ft/s2"])
+
 
 if __name__ == "__main__":
     test_constants()
     test_find()
+    test_find_update()
+    test_freeze()
+    test_pickle()
+    test_derived_units()
+    test_values()
@@ -0,0 +1,73 @@
+import pathlib
+import tempfile
+
+import pytest
+
+from planck import io
+from planck import units
+
+
+def test_convert_parquet(tmp_path):
+    pa = pytest.importorskip("pyarrow")
+    pq = pytest.importorskip("pyarrow.parquet")
+
+    schema = pa.schema(
+        [
+            pa.field("alt", pa.float64(), metadata={"unit": "ft", "desc": "altitude"}),
+            pa.field("p", pa.int32(), metadata={"unit": "psi"}),
+            pa.field("T", pa.float32(), metadata={"unit": "degc"}),
+            pa.field("f", pa.float64(), metadata={"unit": "lb*ft/s2"}),
+            pa.field("v", pa.float64(), metadata={"unit": "kt"}),
+            pa.field("h", pa.float16(), metadata={"unit": "km"}),
+            pa.field("id", pa.string()),
+        ],
+        metadata={"source": "test"},
+    )
+    table = pa.table(
+        {
+            "alt": [1000.0, None, 3000.0],
+            "p": [1, 2, 3],
+            "T": [0.0, 10.0, 20.0],
+            "f": [1.0, 2.0, 3.0],
+            "v": [100.0, 200.0, 300.0],
+            "h": pa.array([1.0, 2.0, 3.0], type=pa.float16()),
+            "id": ["a", "b", "c"],
+        },
+        schema=schema,
+    )
+    source = tmp_path / "source.parquet"
+    destination = tmp_path / "destination.parquet"
+    pq.write_table(table, source, row_group_size=2)
+
+    target = {"length": "m", "pressure": "Pa", "temperature": "K", "force": "N"}
+    assert io.convert_parquet(source, destination, target) == 3
+    assert pq.ParquetFile(destination).num_row_groups == 2
+
+    out = pq.read_table(destination)
+    assert out.schema.metadata == {b"source": b"test"}
+    assert out.schema.field("alt").metadata == {b"unit": b"m", b"desc": b"altitude"}
+    assert out.schema.field("p").type == pa.float64()
+    assert out.schema.field("T").type == pa.float32()
+    assert out.schema.field("T").metadata == {b"unit": b"K"}
+    assert out.schema.field("f").metadata == {b"unit": b"N"}
+
+    # Velocity is not a target quantity
+    assert out.schema.field("v").metadata == {b"unit": b"kt"}
+    assert out.column("v").to_pylist() == [100.0, 200.0, 300.0]
+    assert out.column("id").to_pylist() == ["a", "b", "c"]
+
+    alt = out.column("alt").to_pylist()
+    assert alt[1] is None
+    assert alt[2] == pytest.approx(914.4)
+    assert out.column("p").to_pylist() == pytest.approx(
+        [units.convert(v, "psi", "Pa") for v in [1, 2, 3]]
+    )
+    assert out.column("T").to_pylist() == pytest.approx([273.15, 283.15, 293.15])
+    assert out.column("f").to_pylist()[0] == pytest.approx(0.138254954)
+    assert out.schema.field("h").type == pa.float16()
+    assert out.column("h").to_pylist() == [1000.0, 2000.0, 3000.0]
+
+
+if __name__ == "__main__":
+    with tempfile.TemporaryDirectory() as path:
+        test_convert_parquet(pathlib.Path(path))
@@ -0,0 +1,85 @@
+import pytest
+
+from planck import models
+from planck import units
+
+
+def test_quantity():
+    length = models.Quantity(2.0, "m")
+    time = models.Quantity(4.0, "s")
+
+    speed = length / time
+    assert speed.unit == "m/s"
+    assert speed.to("km/h").value == pytest.approx(1.8)
+    assert speed.dimension == units.dimension("m/s")
+
+    area = length * models.Quantity(1.0, "ft")
+    assert area.unit == "m*ft"
+    assert area.to("m2").value == pytest.approx(0.6096)
+    assert (length**2).unit == "m2"
+    assert (1 / time).to("Hz").value == 0.25
+    assert (3 * length).value == 6.0
+    assert (-length).value == -2.0
+
+    total = length + models.Quantity(1.0, "ft")
+    assert total.unit == "m"
+    assert total.value == pytest.approx(2.3048)
+    assert length > models.Quantity(1.0, "ft")
+    assert length == models.Quantity(2000.0, "mm")
+    assert length != None  # noqa: E711
+    assert length not in [None, 2.0]
+
+    with pytest.raises(TypeError):
+        length + 1.0
+    with pytest.raises(TypeError):
+        assert length < 1.0
+    with pytest.raises(KeyError):
+        length + time
+
+
+def test_quantity_deferred():
+    q = models.Quantity(1.0, "m").to("ft").to("in").to("mm")
+    assert q.unit == "mm"
+    assert q._value == 1.0
+    assert q._converter.scale == pytest.approx(1000.0)
+    assert q.value == pytest.approx(1000.0)
+
+    t = models.Quantity(100.0, "degc").to("F").to("K")
+    assert t.value == pytest.approx(373.15)
+    assert (t * 2).value == pytest.approx(746.3)
+
+
+def test_quantity_array():
+    np = pytest.importorskip("numpy")
+
+    values = np.array([1.0, 2.0, 3.0])
+    q = models.QuantityArray(values, "m").to("ft").to("km")
+    assert q._value is values
+    assert q.shape == (3,)
+    assert len(q) == 3
+    assert np.asarray(q) == pytest.approx(values / 1000.0)
+    assert q[0].value == pytest.approx(0.001)
+
+    speed = np.divide(q, models.Quantity(2.0, "h"))
+    assert isinstance(speed, models.QuantityArray)
+    assert speed.unit == "km/h"
+    assert speed.to("m/s").value == pytest.approx(values / 7200.0)
+
+    total = np.add(q, models.QuantityArray([1.0, 1.0, 1.0], "m"))
+    assert total.unit == "km"
+    assert total.value == pytest.approx((values + 1.0) / 1000.0)
+
+    assert np.sum(models.QuantityArray(values, "m")).to("mm").value == 6000.0
+    assert list(np.less(q, models.Quantity(2.5, "m"))) == [True, True, False]
+    assert np.sqrt(models.QuantityArray([4.0], "m2")).unit == "m"
+    assert np.sin(models.QuantityArray([90.0], "deg")) == pytest.approx(1.0)
+
+    ratio = values * models.Quantity(2.0, "s")
+    assert isinstance(ratio, models.QuantityArray)
+    assert ratio.unit == "s"
+
+
+if __name__ == "__main__":
+    test_quantity()
+    test_quantity_deferred()
+    test_quantity_array()
@@ -0,0 +1,74 @@
+import json
+import pathlib
+import tempfile
+
+import pytest
+
+from planck import _registry
+from planck import constants
+from planck import units
+
+
+def _write(path, definitions):
+    path.write_text(json.dumps(definitions))
+    return str(path)
+
+
+def test_load(tmp_path):
+    path = _write(
+        tmp_path / "site.json",
+        {
+            "units": [
+                {
+                    "symbol": "furlong",
+                    "quantity": "length",
+                    "values": {"m": 201.168, "ft": 660.0},
+                }
+            ],
+            "constants": [
+                {"symbol": "c", "name": "Speed of light", "values": {"m/s": 299792458}},
+                {"symbol": "k_air", "name": "Ratio", "value": 1.4},
+            ],
+        },
+    )
+
+    u, c = _registry.load(path)
+    assert u["furlong"]["ft"] == 660.0
+    assert u["furlong"].name is None
+    assert c["c"]["m/s"] == 299792458
+    assert c["k_air"] == 1.4
+
+    u, c = _registry.load(_registry.DEFINITIONS)
+    assert u["m"]["ft"] == units["m"]["ft"]
+    assert c["g_acc"] == constants["g_acc"]
+    assert c["isa_p0"]["psf"] == c["isa_p0"]["lb/ft2"]
+
+
+def test_invalid(tmp_path):
+    path = _write(tmp_path / "site.json", {"units": [{"symbol": "furlong"}]})
+    with pytest.raises(ValueError):
+        _registry.load(path)
+
+
+def test_units_load(tmp_path):
+    path = _write(
+        tmp_path / "site.json",
+        {"units": [{"symbol": "ly", "quantity": "length", "values": {"m": 9.46e15}}]},
+    )
+
+    from planck.units import Units
+
+    lib = Units({})
+    lib.load(_registry.DEFINITIONS)
+    lib.load(path)
+    assert lib["m"]["ly"] == pytest.approx(1 / 9.46e15)
+    assert lib.convert(1.0, "ly", "km") == pytest.approx(9.46e12)
+
+
+if __name__ == "__main__":
+    with tempfile.TemporaryDirectory() as path:
+        test_load(pathlib.Path(path))
+    with tempfile.TemporaryDirectory() as path:
+        test_invalid(pathlib.Path(path))
+    with tempfile.TemporaryDirectory() as path:
+        test_units_load(pathlib.Path(path))
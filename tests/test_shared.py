@@ -0,0 +1,66 @@
+from concurrent.futures import ProcessPoolExecutor
+
+import pytest
+
+from planck import models
+from planck import units
+from planck.units import Units
+
+
+def _attached_factor(name, input_unit, output_unit):
+    return Units.attach(name)[input_unit][output_unit]
+
+
+def test_share():
+    block = units.share()
+    try:
+        lib = Units.attach(block.name)
+        assert lib.frozen
+        for k in units:
+            assert dict(lib[k]) == dict(units[k])
+        assert lib["GW"]["kW"] == pytest.approx(1e6)
+        assert lib.convert(0.0, "degc", "F") == pytest.approx(32.0)
+        assert lib.convert(1.0, "lb*ft/s2", "N") == units.convert(1.0, "lb*ft/s2", "N")
+        assert lib.find("psi") == ["psi"]
+
+        with pytest.raises(TypeError):
+            lib.register(models.Unit(symbol="furlong", quantity="length", values={}))
+
+        with ProcessPoolExecutor(2) as executor:
+            factor = executor.submit(_attached_factor, block.name, "m", "ft").result()
+        assert factor == units["m"]["ft"]
+        del lib
+    finally:
+        block.close()
+        block.unlink()
+
+
+def test_convert_parallel():
+    np = pytest.importorskip("numpy")
+    from planck.shared import SharedArray
+
+    values = np.random.rand(10_000)
+    expected = units.convert(values, "m", "ft")
+    with ProcessPoolExecutor(2) as executor:
+        out = units.convert_parallel(
+            values, "m", "ft", chunk_size=1000, executor=executor
+        )
+        assert out is not values
+        assert out == pytest.approx(expected)
+
+        with SharedArray.from_array(values.astype("float32")) as shared:
+            out = units.convert_parallel(
+                shared, "degc", "F", chunk_size=3000, executor=executor
+            )
+            assert out is shared.array
+            assert out.dtype == np.float32
+            assert out == pytest.approx(values * 1.8 + 32.0, rel=1e-6)
+            del out
+
+    with pytest.raises(TypeError):
+        units.convert_parallel(np.arange(10), "m", "ft", processes=1)
+
+
+if __name__ == "__main__":
+    test_share()
+    test_convert_parallel()
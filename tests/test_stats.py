@@ -0,0 +1,80 @@
+import planck
+from planck import constants
+from planck import sp_constants
+from planck import units
+from planck import _stats
+from planck.constants import Constants
+from planck.units import Units
+
+
+def test_profile():
+    convert = Units.convert
+    with planck.profile() as snapshot:
+        assert planck.stats()["enabled"]
+        for _ in range(_stats.SCALAR_LOOP_CALLS):
+            units.convert(1.0, "m", "ft")
+        units.convert([1.0, 2.0, 3.0], "psi", "Pa")
+        constants["g_acc"]
+        constants["g_acc"]
+        sp_constants.convert_temperature(0.0, "c", "f")
+        units.convert([0.0, 100.0], "degc", "F")
+
+    # Hooks are removed on exit
+    assert Units.convert is convert
+    assert "__getitem__" not in Constants.__dict__
+    assert not snapshot["enabled"]
+    assert not planck.stats()["enabled"]
+
+    entry = snapshot["conversions"][("m", "ft")]
+    assert entry["calls"] == _stats.SCALAR_LOOP_CALLS
+    assert entry["elements"] == _stats.SCALAR_LOOP_CALLS
+    assert entry["scalar_calls"] == _stats.SCALAR_LOOP_CALLS
+    assert entry["time"] > 0
+    assert snapshot["conversions"][("psi", "Pa")]["elements"] == 3
+    assert snapshot["slow_paths"]["scalar_loop"] == {("m", "ft"): 1}
+    assert snapshot["constants"] == {"g_acc": 2}
+    assert snapshot["temperature"][("c", "f")]["calls"] == 1
+    assert snapshot["temperature"][("degc", "F")]["elements"] == 2
+    assert ("m", "ft") not in snapshot["temperature"]
+
+    assert {"units", "constants", "units_index"} <= set(snapshot["build"])
+    assert all(v["time"] > 0 for v in snapshot["definitions"].values())
+
+    # Conversions are not counted once disabled
+    units.convert(1.0, "m", "ft")
+    assert planck.stats()["conversions"][("m", "ft")]["calls"] == entry["calls"]
+
+
+def test_lazy():
+    import subprocess
+    import sys
+
+    code = "import sys, planck; print('planck._stats' in sys.modules, 'logging' in sys.modules)"
+    out = subprocess.check_output([sys.executable, "-c", code], text=True)
+    assert out.strip() == "False False"
+
+
+def test_profile_nested():
+    with planck.profile():
+        units.convert(1.0, "m", "ft")
+        with planck.profile(reset=False) as inner:
+            units.convert(1.0, "m", "ft")
+        assert inner["enabled"]
+        assert planck.stats()["enabled"]
+        units.convert(1.0, "m", "ft")
+
+    assert planck.stats()["conversions"][("m", "ft")]["calls"] == 3
+
+    with planck.profile(reset=False):
+        units.convert(1.0, "m", "ft")
+    assert planck.stats()["conversions"][("m", "ft")]["calls"] == 4
+
+    with planck.profile() as snapshot:
+        pass
+    assert snapshot["conversions"] == {}
+
+
+if __name__ == "__main__":
+    test_profile()
+    test_lazy()
+    test_profile_nested()
@@ -1,7 +1,28 @@
+import array
+import copy
+import pathlib
+import pickle
+import subprocess
+import sys
+import tempfile
+
 import pytest
 
+from planck import models
+from planck import sp_constants
 from planck import units
 
+# Modules not needed to look up units
+_DEFERRED = (
+    "hashlib",
+    "planck._files",
+    "planck._frames",
+    "planck._search",
+    "planck._streams",
+    "planck.models.converter",
+    "planck.models.quantity",
+)
+
 
 def test_units():
     m = units["m"]
@@ -17,6 +38,159 @@ def test_permutations():
             assert units[k0][k1] == pytest.approx(1.0 / units[k1][k0], rel=0.0001)
 
 
+def test_lazy():
+    code = "import sys, planck; print('planck.units' in sys.modules)"
+    out = subprocess.check_output([sys.executable, "-c", code], text=True)
+    assert out.strip() == "False"
+
+    # Helpers are only imported when used
+    code = (
+        "import sys, planck; planck.units['m']['ft']; "
+        "print([m for m in sys.modules if m in %r])" % (_DEFERRED,)
+    )
+    out = subprocess.check_output([sys.executable, "-c", code], text=True)
+    assert out.strip() == "[]"
+
+    # Build variables are not exposed by the module
+    assert not {"t0", "d", "path"} & set(vars(sys.modules["planck.units"]))
+
+    assert "ft" in units
+    assert "ft" in units.keys()
+    assert units["ft"]["m"] == pytest.approx(0.3048)
+    assert units["m/s"]["m/s"] == 1.0
+    with pytest.raises(KeyError):
+        units["furlong"]
+
+
+def test_unit_view():
+    m = units["m"]
+    assert isinstance(m, models.UnitView)
+    assert dict(m)["ft"] == m["ft"]
+    assert len(m) == len(list(m))
+    assert "ft" in m
+    assert "lb" not in m
+    assert repr(m).startswith("metre [m] - unit of length:")
+
+    # Aliases share the factors of the unit they stand for
+    group = units._groups["Pa"]
+    assert group.index["psi"] == group.index["lb/in2"]
+    assert units["psi"]["Pa"] == units["lb/in2"]["Pa"]
+
+    gm = units["Gm"]
+    assert gm["Gm"] == 1.0
+    assert list(gm)[0] == "Gm"
+    assert gm["ft"] == pytest.approx(units["m"]["ft"] * 1e9)
+
+
+def test_freeze():
+    from planck import _registry
+    from planck.units import Units
+
+    lib = Units({})
+    lib.load(_registry.DEFINITIONS)
+    assert lib.freeze() is lib
+    assert lib.frozen
+    assert dict.get(lib, "m") is not None
+    assert lib["GW"]["kW"] == pytest.approx(1e6)
+    assert lib.convert(1.0, "m", "ft") == units.convert(1.0, "m", "ft")
+
+    with pytest.raises(TypeError):
+        lib["furlong"] = lib["m"]
+    with pytest.raises(TypeError):
+        lib.update({"furlong": lib["m"]})
+    with pytest.raises(TypeError):
+        lib.clear()
+
+
+def test_pickle():
+    units.convert(1.0, "lb*ft/s2", "N")
+    lib = pickle.loads(pickle.dumps(units))
+    assert lib["GW"]["kW"] == pytest.approx(1e6)
+    assert lib.convert(0.0, "degc", "F") == pytest.approx(32.0)
+    assert lib.convert(1.0, "lb*ft/s2", "N") == units.convert(1.0, "lb*ft/s2", "N")
+
+    lib = copy.deepcopy(lib.freeze())
+    assert lib.frozen
+    assert lib.convert(1.0, "m", "ft") == units.convert(1.0, "m", "ft")
+    with pytest.raises(TypeError):
+        lib["furlong"] = lib["m"]
+
+
+def test_threads():
+    from concurrent.futures import ThreadPoolExecutor
+
+    from planck import _registry
+    from planck.units import Units
+
+    lib = Units({})
+    lib.load(_registry.DEFINITIONS)
+    keys = [p + "W" for p in ["k", "M", "G", "T", "m", "mu", "n"]] * 50
+
+    with ThreadPoolExecutor(8) as executor:
+        views = list(executor.map(lambda k: lib[k], keys))
+        factors = list(executor.map(lambda k: lib.convert(1.0, k, "W"), keys))
+
+    for k, v, f in zip(keys, views, factors):
+        assert v is lib[k]
+        assert f == lib[k]["W"]
+
+
+def test_register():
+    from planck import _registry
+    from planck.units import Units
+
+    lib = Units({})
+    lib.load(_registry.DEFINITIONS)
+    m = lib["m"]
+    kw = lib["kW"]
+    assert lib.convert(1.0, "m", "ft") == pytest.approx(3.28084)
+    assert lib.find("furlong") == []
+
+    lib.register(
+        models.Unit(symbol="furlong", quantity="length", values={"m": 201.168})
+    )
+    assert lib["furlong"]["m"] == 201.168
+    assert lib["m"]["furlong"] == pytest.approx(1 / 201.168)
+    assert lib.convert(1.0, "furlong", "ft") == pytest.approx(660.0)
+    assert lib.convert(1.0, "furlong/s", "m/s") == pytest.approx(201.168)
+    assert lib.find("furlong") == ["furlong"]
+
+    # Units not linked to the new unit are kept
+    assert lib["m"] is not m
+    assert lib["kW"] is kw
+
+    lib.register_many(
+        [
+            models.Unit(symbol="cable", quantity="length", values={"m": 185.2}),
+            models.Unit(symbol="fathom", quantity="length", values={"m": 1.8288}),
+        ]
+    )
+    assert lib.convert(1.0, "cable", "fathom") == pytest.approx(185.2 / 1.8288)
+
+    # Redefinition
+    lib.register(models.Unit(symbol="cable", quantity="length", values={"m": 219.456}))
+    assert lib.convert(1.0, "cable", "m") == pytest.approx(219.456)
+
+    lib.freeze()
+    with pytest.raises(TypeError):
+        lib.register(models.Unit(symbol="league", quantity="length", values={}))
+
+
+def test_prefixes():
+    assert units["Gm"]["km"] == 1e6
+    assert units["Gm"].name == "gigametre"
+    assert units["nN"]["N"] == pytest.approx(1e-9)
+    assert units["MW"]["hp"] == pytest.approx(1341.0221)
+    assert units["hm2"]["m2"] == 1e4
+    assert units["dam"]["m"] == 10
+    assert "GW" in units
+    assert "GW" not in units.keys()
+    assert "Gft" not in units
+    assert units.convert(1, "kW", "GW") == pytest.approx(1e-6)
+    assert units.convert(1, "ft", "Gm") == pytest.approx(3.048e-10)
+    assert units.convert(1, "mK", "K") == pytest.approx(1e-3)
+
+
 def test_find():
     assert units.find("Pa") == ["MPa", "Pa", "kPa"]
     assert units.find(quantity="velocity") == [
@@ -27,6 +201,15 @@ def test_find():
         "kt",
         "m/s",
     ]
+    assert units.find("ft/", quantity="VELOCITY") == ["ft/min", "ft/s"]
+    assert units.find("lb/i") == ["lb/in2"]
+    assert units.find("xyz") == []
+    assert units.find() == sorted(units)
+    assert units.find("meter", fuzzy=True)[0] == "m"
+    assert units.find("pascal", fuzzy=True)[0] == "Pa"
+    assert units.symbol("Newton") == "N"
+    with pytest.raises(KeyError):
+        units.symbol("furlong")
 
 
 def test_convert():
@@ -36,8 +219,355 @@ def test_convert():
     assert units.convert([0, 1], "m", "mm") == [0, 1000]
 
 
+def test_convert_temperature():
+    assert sp_constants.convert_temperature(100, "Celsius", "f") == 212
+    assert sp_constants.convert_temperature(491.67, "R", "C") == pytest.approx(0)
+    assert list(sp_constants.convert_temperature([0, 100], "c", "K")) == [
+        273.15,
+        373.15,
+    ]
+    assert sp_constants.temperature_affine("CELSIUS", "kelvin") == (1.0, 273.15)
+    with pytest.raises(NotImplementedError):
+        sp_constants.convert_temperature(0, "C", "X")
+
+    out = array.array("d", [0.0, 100.0])
+    sp_constants.convert_temperature(out, "c", "F", out=out)
+    assert out.tolist() == [32, 212]
+
+    # Prefixed kelvins are absolute temperatures
+    assert units.convert(1.0, "mK", "degc") == pytest.approx(-273.149)
+    assert units.convert(1.0, "mK", "F") == pytest.approx(-459.6682)
+    assert units.convert(1.0, "K", "mK") == pytest.approx(1000.0)
+    assert units.convert(0.0, "degc", "kK") == pytest.approx(0.27315)
+    assert units.compatible("K", "mK") and units.compatible("mK", "K")
+    with pytest.raises(NotImplementedError):
+        units.convert(1.0, "mK", "m")
+
+
+def test_converter():
+    conv = units.converter("m", "ft")
+    assert conv is units.converter("m", "ft")
+    assert conv(2) == 2 * units["m"]["ft"]
+    assert list(conv([0, 1])) == [0, units["m"]["ft"]]
+    assert conv.inverse(conv(3.0)) == pytest.approx(3.0)
+
+    conv = units.converter("km", "m") @ units.converter("ft", "km")
+    assert conv.input_unit == "ft"
+    assert conv.output_unit == "m"
+    assert conv(1.0) == pytest.approx(0.3048)
+    with pytest.raises(ValueError):
+        units.converter("m", "ft") @ units.converter("m", "km")
+
+    conv = units.converter("degc", "F")
+    assert conv(100) == 212
+    assert conv.inverse(32.0) == pytest.approx(0.0)
+    conv = units.converter("degc", "K") @ conv.inverse
+    assert conv(32.0) == pytest.approx(273.15)
+
+
+def test_convert_expression():
+    assert units.convert(1, "lb*ft/s2", "N") == pytest.approx(0.138255, rel=1e-5)
+    assert units.convert(1, "km/h", "m/s") == units["km/h"]["m/s"]
+    assert units.convert(1, "kN*m", "lb*ft") == pytest.approx(737.562, rel=1e-5)
+    assert units.convert(1, "psi", "N/mm2") == pytest.approx(6.894757e-3)
+    assert units.convert(1, "kg*m2/mol/K/s2", "J/mol/K") == pytest.approx(1.0)
+    assert units.convert(1, "m/s^2", "ft/s2") == pytest.approx(units["m"]["ft"])
+    with pytest.raises(KeyError):
+        units.convert(1, "m*kg", "N")
+    with pytest.raises(KeyError):
+        units.convert(1, "furlong/s", "m/s")
+
+    # Whitespace separates terms, as a multiplication
+    assert units.convert(1.0, "m s", "m*s") == 1.0
+    assert units.convert(1.0, "kg m / s2", "N") == 1.0
+    with pytest.raises(KeyError):
+        units.convert(1.0, "m s", "s")
+    with pytest.raises(KeyError):
+        units.convert(1.0, "k g", "g")
+
+    # Converters of free-form expressions are kept in a bounded cache
+    from planck.units import EXPRESSIONS_CACHE_SIZE
+
+    n = len(units._converters)
+    for i in range(EXPRESSIONS_CACHE_SIZE + 10):
+        units.convert(1.0, f"ft*s^{i}/s^{i}", "m")
+    assert len(units._converters) == n
+    info = units._expression_converter.cache_info()
+    assert info.currsize == EXPRESSIONS_CACHE_SIZE
+    assert units.converter("lb*ft/s2", "N") is units.converter("lb*ft/s2", "N")
+
+
+def test_dimension():
+    m = units["m"]
+    assert m.dimension == (1, 0, 0, 0, 0, 0, 0, 0)
+    assert m.scale == 1.0
+    assert units["ft3"].dimension == units.dimension("m3")
+    assert units["ft3"].quantity == "volume"
+    assert units["hp"].scale == pytest.approx(745.69987)
+    assert units.dimension("lb*ft/s2") == units["N"].dimension
+    assert units.compatible("J", "N*m")
+    assert units.compatible("degc/m", "K/ft")
+    assert not units.compatible("m", "furlong")
+    assert units.convert(1, "slug/ft3", "kg/m3") == pytest.approx(515.3788)
+
+    # Compatible units are the ones the converter resolves
+    for u0, u1 in [
+        ("Hz", "rad/s"),
+        ("rpm", "rad/s"),
+        ("Hz", "1/s"),
+        ("kHz", "rpm"),
+        ("rad/s", "deg/s"),
+        ("m", "s"),
+        ("degc", "m"),
+    ]:
+        try:
+            units.convert(1.0, u0, u1)
+            convertible = True
+        except (KeyError, ValueError, NotImplementedError):
+            convertible = False
+        assert units.compatible(u0, u1) == convertible
+    assert units.compatible("Hz", "rad/s")
+
+
+def test_convert_out():
+    np = pytest.importorskip("numpy")
+
+    a = np.array([0.0, 1.0, 2.0], dtype="float32")
+    out = np.empty_like(a)
+    b = units.convert(a, "m", "mm", out=out)
+    assert b is out
+    assert b.dtype == np.float32
+    assert b.tolist() == [0, 1000, 2000]
+
+    b = units.convert(a, "degc", "K", inplace=True)
+    assert b is a
+    assert b.tolist() == pytest.approx([273.15, 274.15, 275.15])
+
+    b = units.convert([1, 2], "m", "mm", dtype="float16")
+    assert b.dtype == np.float16
+    assert units.convert(np.float32(1.0), "m", "mm") == 1000
+    b = units.convert(np.array(1.0), "degc", "K", dtype="float32")
+    assert b.dtype == np.float32
+    assert b == pytest.approx(274.15)
+
+
+def test_convert_workers():
+    np = pytest.importorskip("numpy")
+
+    a = np.random.rand(100_001)
+    for workers in [1, 2, 4]:
+        b = units.convert(a, "degc", "F", workers=workers, chunk_size=1000)
+        assert b == pytest.approx(units.convert(a, "degc", "F"))
+
+    b = units.convert(a.astype("float32"), "m", "ft", workers=2, chunk_size=1000)
+    assert b.dtype == np.float32
+
+    out = np.empty((2, 50_000), dtype="float32")
+    b = a[:100_000].reshape(2, -1)
+    assert units.convert(b, "m", "mm", out=out, workers=2, chunk_size=999) is out
+    assert out == pytest.approx(b * 1000)
+    assert units.convert(b, "m", "mm", inplace=True, workers=2, chunk_size=999) is b
+
+    # Non-contiguous arrays are converted serially
+    b = units.convert(a[::2], "m", "mm", workers=2, chunk_size=1000)
+    assert b == pytest.approx(a[::2] * 1000)
+
+    with pytest.raises(ValueError):
+        units.convert(a, "m", "mm", workers=0)
+
+
+def test_convert_file(tmp_path):
+    np = pytest.importorskip("numpy")
+
+    values = np.random.rand(10_000).astype("float32")
+    source = tmp_path / "values.f32"
+    destination = tmp_path / "converted.f32"
+    values.tofile(source)
+    n = units.convert_file(
+        source, destination, "psi", "Pa", dtype="float32", chunk_size=1000
+    )
+    assert n == len(values)
+    expected = units.convert(values, "psi", "Pa")
+    assert np.fromfile(destination, dtype="float32") == pytest.approx(expected)
+
+    # .npy header is preserved
+    values = np.random.rand(30, 100)
+    source = tmp_path / "values.npy"
+    destination = tmp_path / "converted.npy"
+    np.save(source, values)
+    assert units.convert_file(source, destination, "degc", "K", chunk_size=512) == 3000
+    out = np.load(destination)
+    assert out.shape == (30, 100)
+    assert out == pytest.approx(values + 273.15)
+
+    assert units.convert_file_inplace(source, "degc", "K", chunk_size=512) == 3000
+    assert np.load(source) == pytest.approx(values + 273.15)
+
+    # Destination is the source: converted in place instead of truncated
+    assert units.convert_file(source, source, "K", "degc", chunk_size=512) == 3000
+    assert np.load(source) == pytest.approx(values)
+
+    # Structured records, with selected fields converted
+    dtype = np.dtype([("t", "int64"), ("p", "float64"), ("h", "float32")])
+    records = np.zeros(5001, dtype=dtype)
+    records["t"] = np.arange(5001)
+    records["p"] = np.random.rand(5001)
+    records["h"] = np.random.rand(5001)
+    source = tmp_path / "records.bin"
+    records.tofile(source)
+    units.convert_file_inplace(source, "ft", "m", dtype=dtype, fields=["h"])
+    out = np.fromfile(source, dtype=dtype)
+    assert out["t"].tolist() == records["t"].tolist()
+    assert out["p"].tolist() == records["p"].tolist()
+    assert out["h"] == pytest.approx(records["h"] * 0.3048, rel=1e-6)
+
+    with pytest.raises(ValueError):
+        units.convert_file_inplace(source, "ft", "m", dtype=dtype)
+    with pytest.raises(TypeError):
+        units.convert_file_inplace(source, "ft", "m", dtype=dtype, fields=["t"])
+    with pytest.raises(ValueError):
+        units.convert_file_inplace(source, "ft", "m", dtype="float64")
+
+
+def test_convert_many():
+    values = [1.0, 2.0, 0.0, 100.0]
+    input_units = ["m", "m", "degc", "degc"]
+    output_units = ["ft", "km", "F", "K"]
+    expected = [3.2808398950, 0.002, 32.0, 373.15]
+
+    b = units.convert_many(values, input_units, output_units)
+    assert list(b) == pytest.approx(expected)
+    assert list(units.convert_many([1, 2], "m", "mm")) == [1000, 2000]
+
+    with pytest.raises(ValueError):
+        units.convert_many([1.0], ["m", "m"], "ft")
+
+
+def test_convert_many_numpy():
+    np = pytest.importorskip("numpy")
+
+    input_units = np.array(["m", "ft", "degc"] * 1000)
+    output_units = np.array(["m", "m", "K"] * 1000)
+    b = units.convert_many(np.ones(3000), input_units, output_units)
+    assert isinstance(b, np.ndarray)
+    assert b[:3] == pytest.approx([1.0, 0.3048, 274.15])
+
+
+def test_iconvert():
+    values = (float(i) for i in range(10))
+    b = units.iconvert(values, "km", "m", chunk_size=3)
+    assert next(b) == 0.0
+    assert list(b) == [1000.0 * i for i in range(1, 10)]
+    assert list(units.iconvert([0.0, 100.0], "degc", "K")) == [273.15, 373.15]
+    assert list(units.iconvert([], "m", "ft")) == []
+
+    with pytest.raises(ValueError):
+        list(units.iconvert([1.0], "m", "ft", chunk_size=0))
+
+
+def test_convert_csv(tmp_path):
+    source = tmp_path / "source.csv"
+    source.write_text("t,alt,oat\n0,1000,15\n1,,20\n2,3000,\n")
+    destination = tmp_path / "destination.csv"
+
+    n = units.convert_csv(
+        source,
+        destination,
+        {"alt": ("ft", "m"), "oat": ("degc", "K")},
+        chunk_size=2,
+    )
+    assert n == 3
+    rows = destination.read_text().splitlines()
+    assert rows[0] == "t,alt,oat"
+    assert rows[2] == "1,,293.15"
+    t, alt, oat = rows[3].split(",")
+    assert t == "2"
+    assert float(alt) == pytest.approx(914.4)
+    assert oat == ""
+
+    with pytest.raises(KeyError):
+        units.convert_csv(source, destination, {"tas": ("kt", "m/s")})
+
+
+def test_convert_frame_pandas():
+    pd = pytest.importorskip("pandas")
+
+    df = pd.DataFrame(
+        {
+            "alt": [0.0, 1000.0, None],
+            "tas": pd.Series([100.0, 200.0, 300.0], dtype="float32"),
+            "oat": [0, 15, 30],
+            "label": ["a", "b", "c"],
+        }
+    )
+    df1 = units.convert_frame(
+        df, {"alt": ("ft", "m"), "tas": ("kt", "m/s"), "oat": ("degc", "K")}
+    )
+    assert df1["alt"].tolist()[:2] == pytest.approx([0.0, 304.8])
+    assert df1["alt"].isna().tolist() == [False, False, True]
+    assert df1["tas"].dtype == "float32"
+    assert df1["oat"].tolist() == pytest.approx([273.15, 288.15, 303.15])
+    assert df1["label"].tolist() == ["a", "b", "c"]
+    assert df["alt"].tolist()[:2] == [0.0, 1000.0]
+    with pytest.raises(KeyError):
+        units.convert_frame(df, {"x": ("ft", "m")})
+
+
+def test_convert_frame_arrow():
+    pa = pytest.importorskip("pyarrow")
+
+    table = pa.table(
+        {
+            "alt": pa.chunked_array([[0.0, 1000.0], [None]]),
+            "tas": pa.array([100.0, 200.0, 300.0], type=pa.float32()),
+            "oat": [0, 15, 30],
+            "h": pa.array([1.0, 2.0, None], type=pa.float16()),
+        }
+    )
+    table = table.replace_schema_metadata({"source": "test"})
+    table1 = units.convert_frame(
+        table,
+        {
+            "alt": ("ft", "m"),
+            "tas": ("kt", "m/s"),
+            "oat": ("degc", "K"),
+            "h": ("km", "m"),
+        },
+    )
+    assert table1["alt"].num_chunks == 2
+    assert table1["alt"].to_pylist()[:2] == pytest.approx([0.0, 304.8])
+    assert table1["alt"].null_count == 1
+    assert table1.schema.field("tas").type == pa.float32()
+    assert table1["oat"].to_pylist() == pytest.approx([273.15, 288.15, 303.15])
+    assert table1.schema.metadata == {b"source": b"test"}
+    assert table1.schema.field("h").type == pa.float16()
+    assert table1["h"].to_pylist() == [1000.0, 2000.0, None]
+
+
 if __name__ == "__main__":
     test_units()
     test_permutations()
+    test_lazy()
+    test_unit_view()
+    test_freeze()
+    test_pickle()
+    test_threads()
+    test_register()
+    test_prefixes()
     test_find()
     test_convert()
+    test_convert_temperature()
+    test_converter()
+    test_convert_expression()
+    test_dimension()
+    test_convert_out()
+    test_convert_workers()
+    with tempfile.TemporaryDirectory() as path:
+        test_convert_file(pathlib.Path(path))
+    test_convert_many()
+    test_convert_many_numpy()
+    test_iconvert()
+    with tempfile.TemporaryDirectory() as path:
+        test_convert_csv(pathlib.Path(path))
+    test_convert_frame_pandas()
+    test_convert_frame_arrow()